@@ -20,10 +20,33 @@ Usage:
     uv run add_location_tags.py
 """
 
+import os
 import re
 from pathlib import Path
 
 
+# Module docstring, optionally preceded by a shebang line
+_DOCSTRING_RE = re.compile(r'^(#!/usr/bin/env python3\n)?\s*"""(.*?)"""\s*\n', re.DOTALL)
+_INHERITABLE_TAGS_RE = re.compile(r'(\*\*Inheritable Tags\*\*:\s*)([^\n]+)')
+_LOCATION_TAG_RE = re.compile(r'#location/code-file/[^\s#]+\s*')
+
+
+def iter_python_files(directory: Path):
+    """Yield Python files under directory in sorted path order.
+
+    Entries are sorted per directory while walking, which gives the same order
+    as sorting the full list of paths afterwards.
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_python_files(entry.path)
+        elif entry.name.endswith('.py') and entry.is_file():
+            yield Path(entry.path)
+
+
 def generate_location_tag(filepath: Path, root_dir: Path) -> str:
     """Generate location tag from file path.
 
@@ -43,10 +66,22 @@ def add_location_tag_to_file(filepath: Path, root_dir: Path) -> bool:
     Returns:
         True if file was modified, False otherwise
     """
+    # Generate location tag
+    location_tag = generate_location_tag(filepath, root_dir)
+
+    # Fast path: the tag already sits on the Inheritable Tags line, nothing to do
+    raw = filepath.read_bytes()
+    tag_pos = raw.find(f"#{location_tag}".encode('utf-8'))
+    if tag_pos >= 0:
+        line_start = raw.rfind(b'\n', 0, tag_pos) + 1
+        if b'**Inheritable Tags**:' in raw[line_start:tag_pos]:
+            return False
+
+    # Slow path (rare): text-mode read keeps universal newline handling
     content = filepath.read_text(encoding='utf-8')
 
     # Extract the docstring
-    docstring_match = re.match(r'^(#!/usr/bin/env python3\n)?\s*"""(.*?)"""\s*\n', content, re.DOTALL)
+    docstring_match = _DOCSTRING_RE.match(content)
     if not docstring_match:
         print(f"  WARNING: {filepath.name} has no docstring, skipping")
         return False
@@ -55,11 +90,8 @@ def add_location_tag_to_file(filepath: Path, root_dir: Path) -> bool:
     docstring = docstring_match.group(2)
     rest_of_file = content[docstring_match.end():]
 
-    # Generate location tag
-    location_tag = generate_location_tag(filepath, root_dir)
-
     # Find Inheritable Tags line
-    inheritable_match = re.search(r'(\*\*Inheritable Tags\*\*:\s*)([^\n]+)', docstring)
+    inheritable_match = _INHERITABLE_TAGS_RE.search(docstring)
 
     if not inheritable_match:
         print(f"  WARNING: {filepath.name} has no **Inheritable Tags**: line, skipping")
@@ -69,7 +101,7 @@ def add_location_tag_to_file(filepath: Path, root_dir: Path) -> bool:
     current_tags = inheritable_match.group(2)
 
     # Remove any existing location tag
-    tags_cleaned = re.sub(r'#location/code-file/[^\s#]+\s*', '', current_tags).strip()
+    tags_cleaned = _LOCATION_TAG_RE.sub('', current_tags).strip()
 
     # Add new location tag at the beginning
     new_tags = f"#{location_tag} {tags_cleaned}"
@@ -103,8 +135,8 @@ def main():
     print(f"Code directory: {code_dir}")
     print()
 
-    # Find all Python files
-    python_files = list(code_dir.rglob("*.py"))
+    # Find all Python files (already sorted; counted below, so materialize once)
+    python_files = list(iter_python_files(code_dir))
 
     if not python_files:
         print(f"No Python files found in {code_dir}")
@@ -114,7 +146,7 @@ def main():
     print()
 
     modified_count = 0
-    for py_file in sorted(python_files):
+    for py_file in python_files:
         rel_path = py_file.relative_to(root_dir)
         location_tag = generate_location_tag(py_file, root_dir)
 
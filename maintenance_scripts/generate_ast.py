@@ -20,139 +20,251 @@ Usage:
     python generate_ast.py              # Regenerate all
     python generate_ast.py --clean      # Clean and regenerate
     python generate_ast.py --no-markers # Don't modify source files
+    python generate_ast.py --force      # Regenerate files whose source is unchanged
 """
 
 import ast
 import hashlib
+import inspect
+import io
 import json
+import os
 import re
+import shutil
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson  # Optional: faster metadata serialization
+except ImportError:
+    orjson = None
+
+_WIKILINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
+_TAG_RE = re.compile(r'#([\w/.-]+)')
+_DOCSTRING_RE = re.compile(r'^\s*"""(.*?)"""\s*\n', re.DOTALL)
+_INHERITABLE_TAGS_RE = re.compile(r'\*\*Inheritable Tags\*\*:\s*([^\n]+)')
+
+# Hash of this script: AST files written by any other version of it are
+# regenerated rather than reused
+_GENERATOR_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def _fast_unparse(node: ast.AST) -> str:
+    """ast.unparse with a shortcut for plain names and dotted attribute chains."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and isinstance(node.value, (ast.Name, ast.Attribute)):
+        return f"{_fast_unparse(node.value)}.{node.attr}"
+    return ast.unparse(node)
+
+
+def _fast_docstring(node: ast.AST) -> str:
+    """ast.get_docstring, reading the leading string constant directly; "" if absent."""
+    if not node.body:
+        return ""
+    first = node.body[0]
+    if (isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant)
+            and isinstance(first.value.value, str)):
+        return inspect.cleandoc(first.value.value)
+    return ""
+
+
+# AST-specific tags, keyed by (object type, is schematic)
+_AST_TAGS: Dict[Tuple[str, bool], List[str]] = {
+    (obj_type, is_schematic): ["type/ast-node", f"ast-type/{obj_type}"] + (["status/schematic"] if is_schematic else [])
+    for obj_type in ("function", "method", "class", "constant")
+    for is_schematic in (False, True)
+}
+# Opening of each object's frontmatter, up to the inherited tags
+_FRONTMATTER_PREFIXES: Dict[Tuple[str, bool], str] = {
+    key: "---\ntags:\n" + "".join(f"  - {tag}\n" for tag in tags)
+    for key, tags in _AST_TAGS.items()
+}
+
+# Threads used to overlap AST markdown writes within one source file
+IO_WORKERS = 16
+
+# Directories never searched for Python sources
+SKIPPED_DIRS = {'__pycache__', '.venv', '.git', 'node_modules'}
+
+
+def _iter_python_files(directory: Path):
+    """Yield Python files under directory, pruning SKIPPED_DIRS.
+
+    Same order as rglob: a directory's files first, then its subdirectories.
+    """
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIPPED_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield Path(entry.path)
 
+    for subdir in subdirs:
+        yield from _iter_python_files(subdir)
 
-class BlockMarkerAdder(ast.NodeTransformer):
-    """Add block reference markers to Python source code."""
 
-    def __init__(self, source_lines: List[str]):
-        self.source_lines = source_lines
-        self.markers_added: List[Tuple[int, str]] = []  # (line_num, marker)
+def _json_line(obj: Any) -> bytes:
+    """Serialize obj as one compact UTF-8 JSON line, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
 
-    def add_marker(self, node: ast.AST, marker: str):
-        """Add a block marker to a specific line if not already present."""
-        if not hasattr(node, 'lineno'):
-            return
 
-        lineno = node.lineno - 1  # Convert to 0-indexed
-        if lineno >= len(self.source_lines):
-            return
+def _write_text_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds it; returns True if written.
 
-        line = self.source_lines[lineno]
+    Leaves unchanged files (and their mtimes) alone on no-op regenerations.
+    """
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass  # Missing or unreadable, write it
 
-        # Check if marker already exists
-        if f"# ^{marker}" in line:
-            return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return True
 
-        # Add marker at end of line (before any existing comment)
-        stripped = line.rstrip()
-
-        # If there's already a comment, insert before it
-        if '#' in stripped and not stripped.strip().startswith('#'):
-            # Find the first # that's not in a string
-            comment_pos = stripped.find('#')
-            self.source_lines[lineno] = (
-                stripped[:comment_pos].rstrip() +
-                f"  # ^{marker} " +
-                stripped[comment_pos:] +
-                '\n' if line.endswith('\n') else ''
-            )
-        else:
-            # No existing comment, just append
-            self.source_lines[lineno] = stripped + f"  # ^{marker}\n"
 
-        self.markers_added.append((lineno + 1, marker))
+class _ObjectCollector(ast.NodeVisitor):
+    """Collect functions, classes, ALL_CAPS constants and calls in one traversal.
 
+    After visit(tree), objects holds (node, detail) pairs in ast.walk order:
+    detail is the enclosing class name for methods, the constant name for
+    constants and None otherwise. calls_by_func maps id() of each FunctionDef
+    to the calls made anywhere inside it, including nested functions.
+    """
 
-def add_block_markers_to_source(source_code: str) -> Tuple[str, List[str]]:
+    def __init__(self):
+        self.objects: List[Tuple[ast.AST, Optional[str]]] = []
+        self.calls_by_func: Dict[int, List[str]] = {}
+        self._keyed: List[Tuple[Tuple[int, Tuple[int, ...]], ast.AST, Optional[str]]] = []
+        self._path: List[int] = []  # Child indexes from the root to the current node
+        self._parents: List[ast.AST] = []
+        self._open_calls: List[List[str]] = []  # Call lists of enclosing functions
+
+    def visit(self, node: ast.AST):
+        super().visit(node)
+        if not self._parents:
+            # Breadth-first order is (depth, child index path), as in ast.walk
+            self._keyed.sort(key=lambda entry: entry[0])
+            self.objects = [(obj, detail) for _, obj, detail in self._keyed]
+
+    def generic_visit(self, node: ast.AST):
+        self._parents.append(node)
+        for index, child in enumerate(ast.iter_child_nodes(node)):
+            self._path.append(index)
+            self.visit(child)
+            self._path.pop()
+        self._parents.pop()
+
+    def _record(self, node: ast.AST, detail: Optional[str]):
+        self._keyed.append(((len(self._path), tuple(self._path)), node, detail))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        parent = self._parents[-1]
+        self._record(node, parent.name if isinstance(parent, ast.ClassDef) else None)
+
+        calls = self.calls_by_func[id(node)] = []
+        self._open_calls.append(calls)
+        self.generic_visit(node)
+        self._open_calls.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self._record(node, None)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign):
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id.isupper() and len(target.id) > 1:
+                self._record(node, target.id)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        if self._open_calls:
+            if isinstance(node.func, ast.Name):
+                call = node.func.id
+            elif isinstance(node.func, ast.Attribute):
+                # Handle obj.method() calls
+                call = f"{_fast_unparse(node.func.value)}.{node.func.attr}"
+            else:
+                call = None
+            if call is not None:
+                for calls in self._open_calls:
+                    calls.append(call)
+        self.generic_visit(node)
+
+
+def _append_marker(line: str, marker: str) -> str:
+    """Return line with a block marker added at its end (before any existing comment)."""
+    stripped = line.rstrip()
+
+    # If there's already a comment, insert before it
+    if '#' in stripped and not stripped.strip().startswith('#'):
+        comment_pos = stripped.find('#')
+        return (
+            stripped[:comment_pos].rstrip() +
+            f"  # ^{marker} " +
+            stripped[comment_pos:]
+        )
+
+    # No existing comment, just append
+    return stripped + f"  # ^{marker}"
+
+
+def add_block_markers_to_source(source_code: str) -> Tuple[str, List[str], ast.Module]:
     """Add Obsidian block reference markers to Python source code.
 
     Returns:
-        (modified_source, list_of_markers_added)
+        (modified_source, list_of_markers_added, tree) - markers in source order;
+        tree is the parse of the unmodified source_code
     """
     lines = source_code.split('\n')
-    tree = ast.parse(source_code)
+    tree = ast.parse(source_code, type_comments=False)
 
-    markers_to_add: List[Tuple[int, str]] = []  # (lineno, marker)
+    markers_by_line: Dict[int, List[str]] = {}  # lineno -> markers
+    collector = _ObjectCollector()
+    collector.visit(tree)
 
-    # Walk AST and collect markers to add
-    for node in ast.walk(tree):
+    # Collect markers to add
+    for node, detail in collector.objects:
         if isinstance(node, ast.FunctionDef):
-            # Top-level function or method
-            parent_class = None
-
-            # Check if this function is inside a class
-            for parent in ast.walk(tree):
-                if isinstance(parent, ast.ClassDef):
-                    if node in ast.walk(parent):
-                        # Check if direct child (not nested deeper)
-                        if node in parent.body:
-                            parent_class = parent.name
-                            break
-
-            if parent_class:
-                marker = f"{parent_class}-{node.name}"
-            else:
-                marker = node.name
-
-            markers_to_add.append((node.lineno, marker))
-
+            # Top-level function or method (detail is the parent class)
+            marker = f"{detail}-{node.name}" if detail else node.name
         elif isinstance(node, ast.ClassDef):
             marker = node.name
-            markers_to_add.append((node.lineno, marker))
-
-        elif isinstance(node, ast.Assign):
+        else:
             # Module-level constants (ALL_CAPS)
-            if hasattr(node, 'lineno') and node.lineno is not None:
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        name = target.id
-                        if name.isupper() and len(name) > 1:
-                            markers_to_add.append((node.lineno, name))
+            marker = detail
+        markers_by_line.setdefault(node.lineno, []).append(marker)
 
-    # Sort by line number (reverse) to add from bottom up (preserves line numbers)
-    markers_to_add.sort(reverse=True)
-
-    # Add markers to source
+    # Add markers in a single forward pass over the lines
     added_markers = []
-    for lineno, marker in markers_to_add:
-        idx = lineno - 1  # Convert to 0-indexed
-        if idx >= len(lines):
-            continue
-
-        line = lines[idx]
-
-        # Check if marker already exists
-        if f"# ^{marker}" in line:
-            continue
-
-        # Add marker at end of line
-        stripped = line.rstrip()
-
-        # If there's already a comment, insert before it
-        if '#' in stripped and not stripped.strip().startswith('#'):
-            comment_pos = stripped.find('#')
-            lines[idx] = (
-                stripped[:comment_pos].rstrip() +
-                f"  # ^{marker} " +
-                stripped[comment_pos:]
-            )
-        else:
-            # No existing comment, just append
-            lines[idx] = stripped + f"  # ^{marker}"
-
-        added_markers.append(marker)
-
-    return '\n'.join(lines), added_markers
+    out = []
+    for lineno, line in enumerate(lines, 1):
+        line_markers = markers_by_line.get(lineno)
+        if line_markers:
+            # One scan tells whether any marker is present; most lines have none
+            has_marker = "# ^" in line
+
+            # Several markers on one line (e.g. A = B = 1) go in name order
+            for marker in sorted(line_markers, reverse=True):
+                # Check if marker already exists
+                if has_marker and f"# ^{marker}" in line:
+                    continue
+                line = _append_marker(line, marker)
+                added_markers.append(marker)
+                has_marker = True
+        out.append(line)
+
+    return '\n'.join(out), added_markers, tree
 
 
 class ASTGenerator:
@@ -165,21 +277,29 @@ class ASTGenerator:
         self.root_dir = root_dir
         self.code_dir = root_dir / "code"
         self.ast_cache_dir = root_dir / "ast-cache"
-        self.metadata_file = self.ast_cache_dir / "metadata.json"
+        # JSON Lines: a header line, then one line per source file
+        self.metadata_file = self.ast_cache_dir / "metadata.jsonl"
         self.add_markers = add_markers
+        # One timestamp per run, shared by the header and every file entry
+        self._run_started: Optional[str] = None
+
+    def generate_all(self, clean: bool = False, force: bool = False):
+        """Generate AST cache for all Python files.
 
-    def generate_all(self, clean: bool = False):
-        """Generate AST cache for all Python files."""
+        Files whose source hash matches the previous run's metadata keep their
+        existing AST files unless force is set.
+        """
         if clean and self.ast_cache_dir.exists():
             print(f"Cleaning existing AST cache: {self.ast_cache_dir}")
-            import shutil
             shutil.rmtree(self.ast_cache_dir)
 
+        self._run_started = datetime.now().isoformat()
+
         # Create ast-cache directory structure
         self.ast_cache_dir.mkdir(exist_ok=True)
 
         # Find all Python files
-        python_files = list(self.code_dir.rglob("*.py"))
+        python_files = list(_iter_python_files(self.code_dir))
 
         if not python_files:
             print(f"No Python files found in {self.code_dir}")
@@ -188,54 +308,138 @@ class ASTGenerator:
         print(f"Found {len(python_files)} Python files")
 
         # Generate AST for each file
-        metadata = {
-            "generated_at": datetime.now().isoformat(),
+        header = {
+            "generated_at": self._run_started,
             "generator_version": "2.0.0",
-            "files": {}
+            "generator_hash": _GENERATOR_HASH,
+            "add_markers": self.add_markers,
         }
+        previous_files = {} if force else self._load_previous_files(header)
 
+        # Keep unchanged files, then generate the rest (in parallel when there are several)
+        reused: Dict[Path, Dict[str, Any]] = {}
+        pending: List[Path] = []
         for py_file in python_files:
+            rel_file = str(py_file.relative_to(self.root_dir))
             try:
-                file_metadata = self.generate_ast_for_file(py_file)
-                metadata["files"][str(py_file.relative_to(self.root_dir))] = file_metadata
-                print(f"  Generated: {py_file.relative_to(self.root_dir)}")
-            except Exception as e:
-                print(f"  ERROR: {py_file.relative_to(self.root_dir)}: {e}")
-                import traceback
-                traceback.print_exc()
-
-        # Write metadata
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+                file_metadata = self._reusable_file_metadata(py_file, previous_files.get(rel_file))
+            except OSError:
+                file_metadata = None  # Regenerating reports the error
+            if file_metadata is None:
+                pending.append(py_file)
+            else:
+                reused[py_file] = file_metadata
+
+        generated = dict(zip(pending, self._generate_files(pending)))
+
+        # Stream metadata as each file's entry is settled
+        with open(self.metadata_file, 'wb') as metadata_out:
+            metadata_out.write(_json_line(header))
+
+            for py_file in python_files:
+                rel_file = str(py_file.relative_to(self.root_dir))
+                if py_file in reused:
+                    file_metadata = reused[py_file]
+                    print(f"  Unchanged: {rel_file}")
+                else:
+                    file_metadata, error = generated[py_file]
+                    if error is not None:
+                        message, error_traceback = error
+                        print(f"  ERROR: {rel_file}: {message}")
+                        sys.stderr.write(error_traceback)
+                        continue
+                    if file_metadata["markers_added"]:
+                        print(f"    Added {len(file_metadata['markers_added'])} block markers")
+                    print(f"  Generated: {rel_file}")
+
+                metadata_out.write(_json_line({"file": rel_file, **file_metadata}))
+
+        # Superseded by metadata.jsonl
+        (self.ast_cache_dir / "metadata.json").unlink(missing_ok=True)
+        # Left behind by versions that pickled parse trees
+        shutil.rmtree(self.ast_cache_dir / ".parse-cache", ignore_errors=True)
 
         print(f"\nAST cache generated in: {self.ast_cache_dir}")
         print(f"Metadata: {self.metadata_file}")
 
+    def _generate_files(self, py_files: List[Path]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Tuple[str, str]]]]:
+        """Run generate_ast_for_file for each file, across processes when there are several.
+
+        Returns (file_metadata, error) per file in input order; error is
+        (message, traceback) when generation failed.
+        """
+        if len(py_files) <= 1:
+            return [_generate_file_worker(self, py_file) for py_file in py_files]
+
+        workers = min(os.cpu_count() or 1, len(py_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_file_worker, [self] * len(py_files), py_files,
+                                     chunksize=max(1, len(py_files) // (workers * 4))))
+
+    def _load_previous_files(self, header: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-file metadata from the previous run, if it used the same settings."""
+        files = {}
+        try:
+            with open(self.metadata_file, encoding='utf-8') as f:
+                previous = json.loads(f.readline())
+                if (previous.get("generator_version") != header["generator_version"]
+                        or previous.get("generator_hash") != header["generator_hash"]
+                        or previous.get("add_markers") != header["add_markers"]):
+                    return {}
+                for line in f:
+                    entry = json.loads(line)
+                    files[entry.pop("file")] = entry
+        except (OSError, ValueError, KeyError, AttributeError):
+            return {}
+        return files
+
+    def _reusable_file_metadata(self, py_file: Path,
+                                previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the previous metadata for py_file if its AST files are still current."""
+        if not previous:
+            return None
+
+        source_hash = hashlib.sha256(py_file.read_bytes()).hexdigest()
+        if previous.get("source_hash") != f"sha256:{source_hash[:16]}...":
+            return None
+        if not all((self.root_dir / ast_file).exists() for ast_file in previous.get("ast_files", [])):
+            return None
+
+        return {**previous, "markers_added": []}
+
     def generate_ast_for_file(self, py_file: Path) -> Dict[str, Any]:
         """Generate AST markdown files for all objects in a Python file."""
-        # Read source
-        source = py_file.read_text(encoding='utf-8')
-        original_hash = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        # Read source once; its hash is recorded for the unchanged-file check
+        source_bytes = py_file.read_bytes()
+        source_hash = hashlib.sha256(source_bytes).hexdigest()
+        source = source_bytes.decode('utf-8')
+        if '\r' in source:
+            # Match read_text's universal newline handling
+            source = source.replace('\r\n', '\n').replace('\r', '\n')
 
         # Add block markers to source if requested
         markers_added = []
+        tree = None
         if self.add_markers:
-            modified_source, markers_added = add_block_markers_to_source(source)
+            modified_source, markers_added, tree = add_block_markers_to_source(source)
 
-            # Write modified source back
+            # Write modified source back in a single write
             if markers_added:
-                py_file.write_text(modified_source, encoding='utf-8')
+                modified_bytes = modified_source.encode('utf-8')
+                py_file.write_bytes(modified_bytes)
                 source = modified_source
-                print(f"    Added {len(markers_added)} block markers")
-
-        # Parse AST
-        tree = ast.parse(source, filename=str(py_file))
+                source_hash = hashlib.sha256(modified_bytes).hexdigest()
+                tree = None  # Parsed from the source before markers were added
 
-        # Extract tags from Python file docstring
+        # Parse AST, unless the marker pass already parsed this exact source
+        if tree is None:
+            tree = ast.parse(source, filename=str(py_file), type_comments=False)
+        # Inheritable tags from the module docstring
         source_tags = self._extract_python_tags(source)
 
         # Extract all objects
         objects = self._extract_objects(tree, source)
+        source_lines = source.splitlines()
 
         # Create directory for this file's AST nodes
         rel_path = py_file.relative_to(self.code_dir)
@@ -244,19 +448,26 @@ class ASTGenerator:
 
         # Generate one .ast.md file per object
         ast_files_created = []
+        pending_writes: Dict[Path, str] = {}  # Same-named objects: the last one wins
         for obj in objects:
             ast_file = ast_dir / f"{obj['name']}.ast.md"
-            markdown = self._generate_object_markdown(py_file, obj, objects, source_tags)
-
-            with open(ast_file, 'w', encoding='utf-8') as f:
-                f.write(markdown)
+            pending_writes[ast_file] = self._generate_object_markdown(
+                py_file, obj, objects, source_tags, source_lines)
 
             ast_files_created.append(str(ast_file.relative_to(self.root_dir)))
 
+        # Overlap the writes on a thread pool, surfacing any write error
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool:
+            for write in [io_pool.submit(_write_text_if_changed, path, markdown)
+                          for path, markdown in pending_writes.items()]:
+                write.result()
+
         return {
-            "source_hash": f"sha256:{original_hash[:16]}...",
+            # Hash of the file as left on disk (after markers), which is what
+            # _reusable_file_metadata compares against on the next run
+            "source_hash": f"sha256:{source_hash[:16]}...",
             "ast_dir": str(ast_dir.relative_to(self.root_dir)),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": self._run_started or datetime.now().isoformat(),
             "objects_count": len(objects),
             "ast_files": ast_files_created,
             "markers_added": markers_added
@@ -265,38 +476,29 @@ class ASTGenerator:
     def _extract_objects(self, tree: ast.AST, source: str) -> List[Dict[str, Any]]:
         """Extract all objects (functions, classes, methods, constants) from AST."""
         objects = []
+        collector = _ObjectCollector()
+        collector.visit(tree)
 
-        for node in ast.walk(tree):
+        for node, detail in collector.objects:
             if isinstance(node, ast.FunctionDef):
-                # Determine if it's a method or function
-                parent_class = None
-                for parent in ast.walk(tree):
-                    if isinstance(parent, ast.ClassDef):
-                        if node in parent.body:
-                            parent_class = parent.name
-                            break
-
-                obj = self._extract_function(node, parent_class, source)
-                objects.append(obj)
-
+                # Method if detail names a parent class, else function
+                calls = collector.calls_by_func[id(node)]
+                obj = self._extract_function(node, detail, source, calls)
             elif isinstance(node, ast.ClassDef):
                 obj = self._extract_class(node, source)
-                objects.append(obj)
-
-            elif isinstance(node, ast.Assign):
+            else:
                 # Module-level constants
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        name = target.id
-                        if name.isupper() and len(name) > 1:
-                            obj = self._extract_constant(node, name, source)
-                            objects.append(obj)
+                obj = self._extract_constant(node, detail, source)
+            objects.append(obj)
 
         return objects
 
     def _extract_function(self, node: ast.FunctionDef, parent_class: Optional[str],
-                         source: str) -> Dict[str, Any]:
-        """Extract function/method information."""
+                         source: str, calls: List[str]) -> Dict[str, Any]:
+        """Extract function/method information.
+
+        calls lists the names of functions called within the function.
+        """
         # Determine full name and marker
         if parent_class:
             full_name = f"{parent_class}.{node.name}"
@@ -308,17 +510,17 @@ class ASTGenerator:
             obj_type = "function"
 
         # Extract docstring
-        docstring = ast.get_docstring(node) or ""
+        docstring = _fast_docstring(node)
 
         # Extract signature
         args = []
         for arg in node.args.args:
             arg_str = arg.arg
             if arg.annotation:
-                arg_str += f": {ast.unparse(arg.annotation)}"
+                arg_str += f": {_fast_unparse(arg.annotation)}"
             args.append(arg_str)
 
-        returns = ast.unparse(node.returns) if node.returns else None
+        returns = _fast_unparse(node.returns) if node.returns else None
 
         # Check if schematic
         is_schematic = self._is_schematic(node, docstring)
@@ -326,8 +528,8 @@ class ASTGenerator:
         # Extract wikilinks
         wikilinks = self._extract_wikilinks(docstring)
 
-        # Extract function calls (what this function calls)
-        calls = self._extract_function_calls(node)
+        # Function calls (what this function calls), deduplicated in first-seen order
+        calls = list(dict.fromkeys(calls))
 
         return {
             "name": full_name,
@@ -346,17 +548,14 @@ class ASTGenerator:
 
     def _extract_class(self, node: ast.ClassDef, source: str) -> Dict[str, Any]:
         """Extract class information."""
-        docstring = ast.get_docstring(node) or ""
+        docstring = _fast_docstring(node)
         wikilinks = self._extract_wikilinks(docstring)
 
         # Extract method names
-        methods = []
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                methods.append(item.name)
+        methods = [item.name for item in node.body if isinstance(item, ast.FunctionDef)]
 
         # Extract base classes
-        bases = [ast.unparse(base) for base in node.bases]
+        bases = [_fast_unparse(base) for base in node.bases]
 
         return {
             "name": node.name,
@@ -388,8 +587,7 @@ class ASTGenerator:
 
     def _extract_wikilinks(self, text: str) -> List[str]:
         """Extract all wikilinks from text."""
-        pattern = r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]'
-        return re.findall(pattern, text)
+        return _WIKILINK_RE.findall(text)
 
     def _is_schematic(self, node: ast.FunctionDef, docstring: str) -> bool:
         """Determine if function is a schematic."""
@@ -419,46 +617,30 @@ class ASTGenerator:
         Returns ONLY the inheritable tags (without # prefix).
         """
         # Extract module docstring (first triple-quoted string)
-        match = re.match(r'^\s*"""(.*?)"""\s*\n', source, re.DOTALL)
+        match = _DOCSTRING_RE.match(source)
         if not match:
             return []
 
         docstring = match.group(1)
 
         # Look for "Inheritable Tags:" line specifically
-        inheritable_match = re.search(r'\*\*Inheritable Tags\*\*:\s*([^\n]+)', docstring)
+        inheritable_match = _INHERITABLE_TAGS_RE.search(docstring)
         if inheritable_match:
             tag_line = inheritable_match.group(1)
             # Extract hashtags from this line only (allow dots for file extensions)
-            tags = re.findall(r'#([\w/.-]+)', tag_line)
+            tags = _TAG_RE.findall(tag_line)
             return tags
 
         # Fallback: if no explicit "Inheritable Tags:" line, extract all tags and filter
-        all_tags = re.findall(r'#([\w/.-]+)', docstring)
+        all_tags = _TAG_RE.findall(docstring)
         inheritable_tags = [
             tag for tag in all_tags
             if not tag.startswith('type/')
         ]
         return inheritable_tags
 
-    def _extract_function_calls(self, node: ast.FunctionDef) -> List[str]:
-        """Extract names of functions called within this function."""
-        calls = []
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Name):
-                    calls.append(child.func.id)
-                elif isinstance(child.func, ast.Attribute):
-                    # Handle obj.method() calls
-                    calls.append(f"{ast.unparse(child.func.value)}.{child.func.attr}")
-
-        return list(set(calls))  # Remove duplicates
-
-    def _extract_source_lines(self, py_file: Path, start_line: int, end_line: int) -> str:
-        """Extract specific lines from source file with line numbers."""
-        source_lines = py_file.read_text(encoding='utf-8').splitlines()
-
+    def _extract_source_lines(self, source_lines: List[str], start_line: int, end_line: int) -> str:
+        """Extract specific lines from the source file's lines with line numbers."""
         # Extract the relevant lines (convert to 0-indexed)
         extracted = []
         for i in range(start_line - 1, min(end_line, len(source_lines))):
@@ -470,7 +652,8 @@ class ASTGenerator:
 
     def _generate_object_markdown(self, py_file: Path, obj: Dict[str, Any],
                                   all_objects: List[Dict[str, Any]],
-                                  source_tags: List[str]) -> str:
+                                  source_tags: List[str],
+                                  source_lines: List[str]) -> str:
         """Generate Markdown for a single Python object."""
         rel_path = py_file.relative_to(self.code_dir)
         rel_path_posix = rel_path.as_posix()  # Convert to forward slashes
@@ -488,92 +671,82 @@ class ASTGenerator:
 
         # Extract source code with line numbers
         source_code = self._extract_source_lines(
-            py_file,
+            source_lines,
             obj['lineno'],
             obj.get('end_lineno', obj['lineno'])
         )
 
-        # Determine tags
-        tags = ["type/ast-node", f"ast-type/{obj['type']}"]
-        if obj.get('is_schematic'):
-            tags.append("status/schematic")
+        # AST-specific tags depend only on object type and schematic status
+        tag_key = (obj['type'], bool(obj.get('is_schematic')))
+        ast_tags = _AST_TAGS[tag_key]
 
-        # Add inherited tags from source file
-        tags.extend(source_tags)
+        # Every line is written newline-terminated; the trailing newline is dropped on return
+        buf = io.StringIO()
+        w = buf.write
 
-        # Build frontmatter with YAML list format for tags
-        lines = [
-            "---",
-            "tags:",
-        ]
-        for tag in tags:
-            lines.append(f"  - {tag}")
-        # Separate AST-specific tags from inherited tags
-        ast_tags = ["type/ast-node", f"ast-type/{obj['type']}"]
-        if obj.get('is_schematic'):
-            ast_tags.append("status/schematic")
+        # Build frontmatter with YAML list format for tags: the prebuilt
+        # AST-specific part, then tags inherited from the source file
+        w(_FRONTMATTER_PREFIXES[tag_key])
+        for tag in source_tags:
+            w(f"  - {tag}\n")
 
         # Format line number range
         line_range = f"{obj['lineno']}"
         if obj.get('end_lineno') and obj['end_lineno'] != obj['lineno']:
             line_range = f"{obj['lineno']}-{obj['end_lineno']}"
 
-        lines.extend([
-            f"source_file: {back_to_root}code/{rel_path_posix}",
-            f"block_marker: ^{obj['marker']}",
-            f"object_type: {obj['type']}",
-            f"line_start: {obj['lineno']}",
-            f"line_end: {obj.get('end_lineno', obj['lineno'])}",
-            "---",
-            "",
-            "> [!WARNING] Generated Code - Do Not Edit",
-            f"> This file is auto-generated. Please edit the source code block in [[{back_to_root}code/{rel_path_posix}#^{obj['marker']}]] and run `uv run update.py` to regenerate.",
-            "",
-            f"# {obj['name']}",
-            "",
-            f"**Source**: {source_link} (lines {line_range})",
-            f"**Type**: {obj['type']}",
-            ""
-        ])
+        w(f"source_file: {back_to_root}code/{rel_path_posix}\n")
+        w(f"block_marker: ^{obj['marker']}\n")
+        w(f"object_type: {obj['type']}\n")
+        w(f"line_start: {obj['lineno']}\n")
+        w(f"line_end: {obj.get('end_lineno', obj['lineno'])}\n")
+        w("---\n")
+        w("\n")
+        w("> [!WARNING] Generated Code - Do Not Edit\n")
+        w(f"> This file is auto-generated. Please edit the source code block in [[{back_to_root}code/{rel_path_posix}#^{obj['marker']}]] and run `uv run update.py` to regenerate.\n")
+        w("\n")
+        w(f"# {obj['name']}\n")
+        w("\n")
+        w(f"**Source**: {source_link} (lines {line_range})\n")
+        w(f"**Type**: {obj['type']}\n")
+        w("\n")
 
         # Brief tag inheritance note (no links to avoid graph clutter)
         if source_tags:
-            lines.extend([
-                f"**Tags**: {len(source_tags)} inherited from module + {len(ast_tags)} AST-specific",
-                ""
-            ])
+            w(f"**Tags**: {len(source_tags)} inherited from module + {len(ast_tags)} AST-specific\n")
+            w("\n")
         else:
-            lines.append("")
+            w("\n")
 
         # Type-specific information
         if obj['type'] == 'function' or obj['type'] == 'method':
-            lines.append(f"**Signature**: `{obj['signature']}`")
+            w(f"**Signature**: `{obj['signature']}`\n")
             if obj.get('returns'):
-                lines.append(f"**Returns**: `{obj['returns']}`")
+                w(f"**Returns**: `{obj['returns']}`\n")
             if obj.get('is_schematic'):
-                lines.append(f"**Status**: SCHEMATIC (not yet implemented)")
-            lines.append("")
+                w("**Status**: SCHEMATIC (not yet implemented)\n")
+            w("\n")
 
             # Docstring
             if obj.get('docstring'):
-                lines.append("## Documentation")
-                lines.append("")
-                lines.append(obj['docstring'])
-                lines.append("")
+                w("## Documentation\n")
+                w("\n")
+                w(obj['docstring'])
+                w("\n\n")
 
             # Source code with line numbers
-            lines.append("## Source Code")
-            lines.append("")
-            lines.append(f"```python")
-            lines.append(source_code)
-            lines.append("```")
-            lines.append("")
+            w("## Source Code\n")
+            w("\n")
+            w("```python\n")
+            w(source_code)
+            w("\n```\n")
+            w("\n")
 
             # Function calls
             if obj.get('calls'):
-                lines.append("## Calls")
-                lines.append("")
-                lines.append("This function calls:")
+                w("## Calls\n")
+                w("\n")
+                w("This function calls:\n")
                 for call in obj['calls']:
                     # Try to create link to AST node if it exists
                     link_created = False
@@ -590,70 +763,81 @@ class ASTGenerator:
                             (call_name.startswith('_') and other_name.endswith(call_name))):
 
                             # Create relative link to other AST file
-                            lines.append(f"- [[{other_name}.ast.md|{call}]] (internal)")
+                            w(f"- [[{other_name}.ast.md|{call}]] (internal)\n")
                             link_created = True
                             break
 
                     if not link_created:
-                        lines.append(f"- `{call}` (external or built-in)")
-                lines.append("")
+                        w(f"- `{call}` (external or built-in)\n")
+                w("\n")
 
         elif obj['type'] == 'class':
             if obj.get('bases'):
-                lines.append(f"**Inherits**: {', '.join(obj['bases'])}")
-                lines.append("")
+                w(f"**Inherits**: {', '.join(obj['bases'])}\n")
+                w("\n")
 
             # Docstring
             if obj.get('docstring'):
-                lines.append("## Documentation")
-                lines.append("")
-                lines.append(obj['docstring'])
-                lines.append("")
+                w("## Documentation\n")
+                w("\n")
+                w(obj['docstring'])
+                w("\n\n")
 
             # Source code with line numbers
-            lines.append("## Source Code")
-            lines.append("")
-            lines.append(f"```python")
-            lines.append(source_code)
-            lines.append("```")
-            lines.append("")
+            w("## Source Code\n")
+            w("\n")
+            w("```python\n")
+            w(source_code)
+            w("\n```\n")
+            w("\n")
 
             # Methods
             if obj.get('methods'):
-                lines.append("## Methods")
-                lines.append("")
+                w("## Methods\n")
+                w("\n")
                 for method in obj['methods']:
                     method_link = f"[[{obj['name']}.{method}.ast.md|{method}]]"
-                    lines.append(f"- {method_link}")
-                lines.append("")
+                    w(f"- {method_link}\n")
+                w("\n")
 
         elif obj['type'] == 'constant':
-            lines.append(f"**Value**: `{obj.get('value', 'N/A')}`")
-            lines.append("")
+            w(f"**Value**: `{obj.get('value', 'N/A')}`\n")
+            w("\n")
 
             # Source code with line numbers
-            lines.append("## Source Code")
-            lines.append("")
-            lines.append(f"```python")
-            lines.append(source_code)
-            lines.append("```")
-            lines.append("")
+            w("## Source Code\n")
+            w("\n")
+            w("```python\n")
+            w(source_code)
+            w("\n```\n")
+            w("\n")
 
         # Wikilinks in docstring
         if obj.get('wikilinks'):
-            lines.append("## Documentation References")
-            lines.append("")
-            lines.append("Links to conceptual documentation:")
+            w("## Documentation References\n")
+            w("\n")
+            w("Links to conceptual documentation:\n")
             for link in obj['wikilinks']:
                 # All wikilinks should be clickable, no backticks
-                lines.append(f"- [[{link}]]")
-            lines.append("")
+                w(f"- [[{link}]]\n")
+            w("\n")
+
+        return buf.getvalue()[:-1]
 
-        return '\n'.join(lines)
+
+def _generate_file_worker(generator: ASTGenerator, py_file: Path):
+    """Process pool entry point: generate one file's AST files.
+
+    Returns (file_metadata, error), capturing any exception as
+    (message, traceback) so one bad file doesn't stop the run.
+    """
+    try:
+        return generator.generate_ast_for_file(py_file), None
+    except Exception as e:
+        return None, (str(e), traceback.format_exc())
 
 
 def main():
-    import sys
 
     # Script is in maintenance_scripts/, root is parent
     root_dir = Path(__file__).parent.parent
@@ -661,6 +845,7 @@ def main():
     # Parse arguments
     clean = "--clean" in sys.argv
     no_markers = "--no-markers" in sys.argv
+    force = "--force" in sys.argv
 
     generator = ASTGenerator(root_dir, add_markers=not no_markers)
 
@@ -674,7 +859,7 @@ def main():
     print(f"Add block markers: {not no_markers}")
     print()
 
-    generator.generate_all(clean=clean)
+    generator.generate_all(clean=clean, force=force)
 
     print()
     print("=" * 60)
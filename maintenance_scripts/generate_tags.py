@@ -18,14 +18,66 @@ Usage:
     uv run generate_tags.py
 """
 
+import codecs
+import os
 import re
 import yaml
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 
 
+# Frontmatter and module docstrings normally fit well inside this many bytes
+HEAD_BYTES = 4096
+
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_TAG_LIST_RE = re.compile(r'tags:\s*\n((?:\s+-\s+.+\n?)+)')
+_DOCSTRING_RE = re.compile(r'^\s*"""(.*?)"""\s*\n', re.DOTALL)
+_TAGS_LINE_RE = re.compile(r'\*\*Tags\*\*:\s*(.+)$', re.MULTILINE)
+_HASHTAG_RE = re.compile(r'#([\w/-]+)')
+
+
+def _parse_inline_tags(yaml_content: str) -> Optional[List[str]]:
+    """Extract tags from an inline `tags: [tag1, tag2]` list with plain string scanning.
+
+    Returns None when there is no inline tags list on a single line.
+    """
+    start = yaml_content.find('tags:')
+    while start >= 0:
+        rest = yaml_content[start + 5:].lstrip()
+        if rest.startswith('['):
+            end = rest.find(']')
+            if end >= 0 and '\n' not in rest[1:end]:
+                return [t.strip(' \t"\'') for t in rest[1:end].split(',')]
+        start = yaml_content.find('tags:', start + 1)
+    return None
+
+
+def _component_pattern(names: Set[str]) -> re.Pattern:
+    """Regex matching a POSIX path that has any of names as a whole component."""
+    alternatives = '|'.join(re.escape(name) for name in sorted(names))
+    return re.compile(rf'(?:^|/)(?:{alternatives})(?:/|$)')
+
+
+def _iter_tagged_files(directory: Path, skip_dirs: Set[str]):
+    """Yield Python and markdown files under directory, pruning skip_dirs.
+
+    Same order as rglob: a directory's files first, then its subdirectories.
+    """
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(('.py', '.md')) and entry.is_file():
+                yield Path(entry.path)
+
+    for subdir in subdirs:
+        yield from _iter_tagged_files(subdir, skip_dirs)
+
+
 class TagScanner:
     """Scans repository and collects tag data from all files."""
 
@@ -39,23 +91,23 @@ class TagScanner:
 
         # Directories to skip
         self.skip_dirs = {'.git', '.obsidian', '__pycache__', 'node_modules', '.venv', 'venv', 'whiteboard'}
+        self._skip_dirs_re = _component_pattern(self.skip_dirs)
 
     def parse_yaml_frontmatter(self, content: str) -> List[str]:
         """Extract tags from YAML frontmatter."""
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         if not match:
             return []
 
         yaml_content = match.group(1)
 
         # Try inline array format first: tags: [tag1, tag2, tag3]
-        tags_match_inline = re.search(r'tags:\s*\[(.*?)\]', yaml_content)
-        if tags_match_inline:
-            tags_str = tags_match_inline.group(1)
-            return [t.strip().strip('"').strip("'") for t in tags_str.split(',')]
+        inline_tags = _parse_inline_tags(yaml_content)
+        if inline_tags is not None:
+            return inline_tags
 
         # Try YAML list format: tags:\n  - tag1\n  - tag2
-        tags_match_list = re.search(r'tags:\s*\n((?:\s+-\s+.+\n?)+)', yaml_content)
+        tags_match_list = _TAG_LIST_RE.search(yaml_content)
         if tags_match_list:
             tags_str = tags_match_list.group(1)
             return [line.strip().lstrip('-').strip() for line in tags_str.strip().split('\n')]
@@ -65,28 +117,48 @@ class TagScanner:
     def parse_python_docstring_tags(self, content: str) -> List[str]:
         """Extract tags from Python custom frontmatter format."""
         # Extract module docstring
-        match = re.match(r'^\s*"""(.*?)"""\s*\n', content, re.DOTALL)
+        match = _DOCSTRING_RE.match(content)
         if not match:
             return []
 
         docstring = match.group(1)
 
         # Extract inline tags: **Tags**: #tag1 #tag2 #tag3
-        tags_match = re.search(r'\*\*Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
+        tags_match = _TAGS_LINE_RE.search(docstring)
         if not tags_match:
             return []
 
         tags_line = tags_match.group(1)
         # Extract all #hashtags (without the # prefix)
-        tags = re.findall(r'#([\w/-]+)', tags_line)
+        tags = _HASHTAG_RE.findall(tags_line)
         return tags
 
+    def read_head(self, filepath: Path) -> Tuple[str, bool]:
+        """Read the start of a file, where its frontmatter or module docstring lives.
+
+        Returns:
+            (text, is_complete) - is_complete is False when the file is longer than the head
+        """
+        with open(filepath, 'rb') as f:
+            data = f.read(HEAD_BYTES + 1)
+
+        is_complete = len(data) <= HEAD_BYTES
+        if is_complete:
+            text = data.decode('utf-8')
+        else:
+            # Incremental decode tolerates a multi-byte character cut at the boundary
+            text = codecs.getincrementaldecoder('utf-8')().decode(data[:HEAD_BYTES])
+
+        if b'\r' in data:
+            # Match read_text's universal newline handling
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text, is_complete
+
     def should_skip_path(self, path: Path) -> bool:
         """Check if a path should be skipped."""
-        # Skip directories in skip list
-        for part in path.parts:
-            if part in self.skip_dirs:
-                return True
+        # Skip directories in skip list (one search over the path string)
+        if self._skip_dirs_re.search(path.as_posix()):
+            return True
 
         # Skip auto-generated tag index files
         if path.name in ['repository-map.md', 'tag-index.md']:
@@ -99,17 +171,24 @@ class TagScanner:
         if self.should_skip_path(filepath):
             return
 
-        try:
-            content = filepath.read_text(encoding='utf-8')
-            tags = []
+        # Only Python and markdown files carry tags
+        if filepath.suffix not in ('.py', '.md'):
+            return
 
-            # Determine file type and extract tags
+        try:
+            # Parse tags from the head first; fall back to the full file only when
+            # the frontmatter/docstring may extend past it
+            content, is_complete = self.read_head(filepath)
+            parse_tags = (self.parse_python_docstring_tags if filepath.suffix == '.py'
+                          else self.parse_yaml_frontmatter)
+            tags = parse_tags(content)
+            if not tags and not is_complete:
+                tags = parse_tags(filepath.read_text(encoding='utf-8'))
+
+            # Count files by type
             if filepath.suffix == '.py':
-                tags = self.parse_python_docstring_tags(content)
                 self.file_counts['python'] += 1
             elif filepath.suffix == '.md':
-                tags = self.parse_yaml_frontmatter(content)
-
                 # Categorize markdown files by type tag
                 if 'type/concept' in tags:
                     self.file_counts['concept'] += 1
@@ -137,10 +216,9 @@ class TagScanner:
         """Scan entire repository for tags."""
         print("Scanning repository for tags...")
 
-        # Recursively scan all files
-        for filepath in self.root_dir.rglob('*'):
-            if filepath.is_file():
-                self.scan_file(filepath)
+        # Recursively scan all Python and markdown files, skipping whole directories
+        for filepath in _iter_tagged_files(self.root_dir, self.skip_dirs):
+            self.scan_file(filepath)
 
         print(f"Found {len(self.all_tags)} unique tags across {sum(self.file_counts.values())} files")
 
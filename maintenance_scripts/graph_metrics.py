@@ -22,14 +22,66 @@ Usage:
     uv run graph_metrics.py
 """
 
+import os
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict, Counter
 from dataclasses import dataclass
 
 
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_INLINE_TAGS_RE = re.compile(r'tags:\s*\[(.*?)\]')
+_TAG_LIST_RE = re.compile(r'tags:\s*\n((?:\s+-\s+.+\n?)+)')
+_DOCSTRING_RE = re.compile(r'^\s*"""(.*?)"""\s*\n', re.DOTALL)
+_FILE_TAGS_RE = re.compile(r'\*\*File Tags\*\*:\s*(.+)$', re.MULTILINE)
+_INHERITABLE_TAGS_RE = re.compile(r'\*\*Inheritable Tags\*\*:\s*(.+)$', re.MULTILINE)
+_TAGS_LINE_RE = re.compile(r'\*\*Tags\*\*:\s*(.+)$', re.MULTILINE)
+_HASHTAG_RE = re.compile(r'#([\w/.-]+)')
+# Matches [[link]] or [[link|display]]
+_WIKILINK_RE = re.compile(r'\[\[([^\]]+)\]\]')
+
+
+def _component_pattern(names: Set[str]) -> re.Pattern:
+    """Regex matching a POSIX path that has any of names as a whole component."""
+    alternatives = '|'.join(re.escape(name) for name in sorted(names))
+    return re.compile(rf'(?:^|/)(?:{alternatives})(?:/|$)')
+
+
+def _iter_files(directory: Path, skip_dirs: Set[str], suffixes: Optional[Set[str]] = None):
+    """Yield every file under directory, pruning skip_dirs.
+
+    If suffixes is given, only files with one of those suffixes are yielded;
+    names are checked before any Path is built.
+    Same order as rglob: a directory's files first, then its subdirectories.
+    """
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    subdirs.append(entry.path)
+            elif suffixes is not None and os.path.splitext(entry.name)[1] not in suffixes:
+                continue
+            elif entry.is_file():
+                yield Path(entry.path)
+
+    for subdir in subdirs:
+        yield from _iter_files(subdir, skip_dirs, suffixes)
+
+
+def _may_have_metrics(data: bytes, suffix: str) -> bool:
+    """Cheap byte-level check for anything scan_file would extract."""
+    if b'[[' in data:
+        return True
+    if suffix == '.md':
+        return data.startswith(b'---')
+    if suffix == '.py':
+        return b'Tags**:' in data
+    return False
+
+
 @dataclass
 class TagMetrics:
     """Metrics for a single tag."""
@@ -64,23 +116,26 @@ class GraphMetricsAnalyzer:
         self.all_tags: Set[str] = set()
         # Don't skip ast-cache since we want to count those files for tag coverage
         self.skip_dirs = {'.git', '.obsidian', '__pycache__', 'node_modules', '.venv', 'venv', 'whiteboard', 'index'}
+        # Tool state files that are not vault content (janitor scan cache)
+        self.skip_files = {'.janitor_cache.json'}
+        self._skip_dirs_re = _component_pattern(self.skip_dirs)
 
     def parse_yaml_frontmatter(self, content: str) -> List[str]:
         """Extract tags from YAML frontmatter."""
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         if not match:
             return []
 
         yaml_content = match.group(1)
 
         # Try inline array format
-        tags_match_inline = re.search(r'tags:\s*\[(.*?)\]', yaml_content)
+        tags_match_inline = _INLINE_TAGS_RE.search(yaml_content)
         if tags_match_inline:
             tags_str = tags_match_inline.group(1)
             return [t.strip().strip('"').strip("'") for t in tags_str.split(',')]
 
         # Try YAML list format
-        tags_match_list = re.search(r'tags:\s*\n((?:\s+-\s+.+\n?)+)', yaml_content)
+        tags_match_list = _TAG_LIST_RE.search(yaml_content)
         if tags_match_list:
             tags_str = tags_match_list.group(1)
             return [line.strip().lstrip('-').strip() for line in tags_str.strip().split('\n')]
@@ -102,7 +157,7 @@ class GraphMetricsAnalyzer:
         else:
             content_to_parse = content
 
-        match = re.match(r'^\s*"""(.*?)"""\s*\n', content_to_parse, re.DOTALL)
+        match = _DOCSTRING_RE.match(content_to_parse)
         if not match:
             return []
 
@@ -110,39 +165,37 @@ class GraphMetricsAnalyzer:
         all_tags = []
 
         # Try new format first (File Tags + Inheritable Tags)
-        file_tags_match = re.search(r'\*\*File Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
-        inheritable_tags_match = re.search(r'\*\*Inheritable Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
+        file_tags_match = _FILE_TAGS_RE.search(docstring)
+        inheritable_tags_match = _INHERITABLE_TAGS_RE.search(docstring)
 
         if file_tags_match or inheritable_tags_match:
             # New format detected
             if file_tags_match:
-                file_tags = re.findall(r'#([\w/.-]+)', file_tags_match.group(1))
+                file_tags = _HASHTAG_RE.findall(file_tags_match.group(1))
                 all_tags.extend(file_tags)
             if inheritable_tags_match:
-                inheritable_tags = re.findall(r'#([\w/.-]+)', inheritable_tags_match.group(1))
+                inheritable_tags = _HASHTAG_RE.findall(inheritable_tags_match.group(1))
                 all_tags.extend(inheritable_tags)
         else:
             # Fallback to old format (**Tags**: #tag1 #tag2 #tag3)
-            tags_match = re.search(r'\*\*Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
+            tags_match = _TAGS_LINE_RE.search(docstring)
             if tags_match:
                 tags_line = tags_match.group(1)
-                all_tags = re.findall(r'#([\w/.-]+)', tags_line)
+                all_tags = _HASHTAG_RE.findall(tags_line)
 
         tags = all_tags
         return tags
 
     def count_wikilinks(self, content: str) -> int:
         """Count wikilinks in file content."""
-        # Match [[link]] or [[link|display]]
-        wikilinks = re.findall(r'\[\[([^\]]+)\]\]', content)
+        wikilinks = _WIKILINK_RE.findall(content)
         return len(wikilinks)
 
     def should_skip_path(self, path: Path) -> bool:
         """Check if a path should be skipped."""
-        for part in path.parts:
-            if part in self.skip_dirs:
-                return True
-        return False
+        if path.name in self.skip_files:
+            return True
+        return self._skip_dirs_re.search(path.as_posix()) is not None
 
     def scan_file(self, filepath: Path) -> None:
         """Scan a single file for tags and wikilinks."""
@@ -150,7 +203,16 @@ class GraphMetricsAnalyzer:
             return
 
         try:
-            content = filepath.read_text(encoding='utf-8')
+            data = filepath.read_bytes()
+
+            # Only decode files that can hold tags or wikilinks
+            if not _may_have_metrics(data, filepath.suffix):
+                return
+
+            content = data.decode('utf-8')
+            if b'\r' in data:
+                # Match read_text's universal newline handling
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             tags = []
             wikilinks = self.count_wikilinks(content)
 
@@ -174,9 +236,8 @@ class GraphMetricsAnalyzer:
 
     def scan_repository(self) -> None:
         """Scan entire repository."""
-        for filepath in self.root_dir.rglob('*'):
-            if filepath.is_file():
-                self.scan_file(filepath)
+        for filepath in _iter_files(self.root_dir, self.skip_dirs):
+            self.scan_file(filepath)
 
     def analyze_tag_sizes(self) -> Tuple[List[TagMetrics], List[TagMetrics]]:
         """Identify oversized and undersized tags."""
@@ -212,11 +273,10 @@ class GraphMetricsAnalyzer:
     def analyze_orphaned_files(self) -> List[Path]:
         """Find files with no tags."""
         orphaned = []
-        for filepath in self.root_dir.rglob('*'):
-            if filepath.is_file() and not self.should_skip_path(filepath):
-                if filepath.suffix in ['.py', '.md']:
-                    if filepath not in self.file_to_tags or not self.file_to_tags[filepath]:
-                        orphaned.append(filepath)
+        for filepath in _iter_files(self.root_dir, self.skip_dirs, {'.py', '.md'}):
+            if not self.should_skip_path(filepath):
+                if filepath not in self.file_to_tags or not self.file_to_tags[filepath]:
+                    orphaned.append(filepath)
         return orphaned
 
     def analyze_wikilink_density(self) -> List[FileMetrics]:
@@ -16,18 +16,277 @@ Usage:
     python janitor.py              # Check for issues
     python janitor.py --fix        # Auto-fix issues with confirmation
     python janitor.py --fix --yes  # Auto-fix without confirmation
+    python janitor.py --stdin obsidian/note.md < buffer  # Check unsaved editor buffer
+    python janitor.py --stream     # Print issues as they are found, then the report
 """
 
+import ast
+import bisect
+import functools
+import hashlib
+import json
 import os
 import re
+import subprocess
 import sys
 import yaml
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Callable, Dict, Iterator, List, Set, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 
 
-@dataclass
+# libyaml's C loader when PyYAML was built with it; same results as safe_load, much faster
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Precompiled patterns for the per-file parsing and fixing hot paths
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_DOCSTRING_RE = re.compile(r'^\s*"""(.*?)"""\s*\n', re.DOTALL)
+_REQUIRED_TAG_MESSAGE_RE = re.compile(r"Missing required tag: (.+)$")
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_FILE_TAGS_RE = re.compile(r'\*\*File Tags\*\*:\s*(.+)$', re.MULTILINE)
+_INHERITABLE_TAGS_RE = re.compile(r'\*\*Inheritable Tags\*\*:\s*(.+)$', re.MULTILINE)
+_TAGS_LINE_RE = re.compile(r'\*\*Tags\*\*:\s*(.+)$', re.MULTILINE)
+_HASHTAG_RE = re.compile(r'#([\w/.-]+)')
+# Same matches as ^##\s+Purpose; leading with the literal lets re skip ahead to each '##'
+_PURPOSE_RE = re.compile(r'##(?<=^##)\s+Purpose', re.MULTILINE)
+# `  - tag` item of a block list, where the tag is a plain scalar YAML reads as a string
+_TAG_LIST_ITEM_RE = re.compile(r'( *)- +([^\W\d_][\w/.-]*) *')
+# Plain scalars YAML would resolve to booleans or null instead of strings
+_YAML_NON_STRING_WORDS = frozenset({'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+# The patterns below are run over whole files, so none of them match across a newline
+_BLOCK_MARKER_RE = re.compile(r'#[^\S\n]*\^(\S+)')
+# [[link]], [[link#section]] or [[link|display]]; captures the link path
+_WIKILINK_RE = re.compile(r'\[\[([^\]|#\n]+)(?:#[^\]|\n]+)?(?:\|[^\]\n]+)?\]\]')
+# [[file#^marker]] or [[file#^marker|display]]; captures file and marker
+_BLOCK_REF_RE = re.compile(r'\[\[([^\]\n]+?)#\^([^\]|\n]+)(?:\|[^\]\n]+)?\]\]')
+
+
+def _line_starts(content: str) -> List[int]:
+    """Offsets at which each line of content starts (line N starts at index N-1)."""
+    starts = [0]
+    newline = content.find('\n')
+    while newline >= 0:
+        starts.append(newline + 1)
+        newline = content.find('\n', newline + 1)
+    return starts
+
+
+def _line_at(content: str, line_starts: List[int], lineno: int) -> str:
+    """Text of line lineno (1-based) without its newline."""
+    end = line_starts[lineno] - 1 if lineno < len(line_starts) else len(content)
+    return content[line_starts[lineno - 1]:end]
+
+
+# Nodes that can hold statements; expressions never do
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _walk_statements(tree: ast.AST):
+    """Like ast.walk, but without descending into expressions.
+
+    Yields the same statement nodes in the same breadth-first order.
+    """
+    queue = [tree]
+    for node in queue:
+        yield node
+        queue.extend(child for child in ast.iter_child_nodes(node)
+                     if isinstance(child, _STATEMENT_CONTAINERS))
+
+
+def _parse_tags_only_frontmatter(yaml_content: str) -> Optional[List[str]]:
+    """Parse frontmatter that holds nothing but a block list of plain tags.
+
+    This is the usual shape of vault frontmatter, and the result is what
+    yaml.safe_load gives for it. Returns None for anything else, which must
+    go through the YAML parser.
+    """
+    lines = yaml_content.split('\n')
+    if lines[0].rstrip(' ') != 'tags:':
+        return None
+
+    tags = []
+    indent = None
+    for line in lines[1:]:
+        match = _TAG_LIST_ITEM_RE.fullmatch(line)
+        if match is None:
+            if line.strip(' '):
+                return None
+            continue
+        if indent is None:
+            indent = match.group(1)
+        tag = match.group(2)
+        if match.group(1) != indent or tag.lower() in _YAML_NON_STRING_WORDS:
+            return None
+        tags.append(tag)
+    return tags or None
+
+
+def _find_inline_tags(content: str) -> Optional[Tuple[int, int, str]]:
+    """Locate the first single-line `tags: [...]` list.
+
+    Returns:
+        (start, end, inner) - slice bounds of the whole `tags: [...]` text and the
+        text between the brackets, or None if there is no inline tags list
+    """
+    start = content.find('tags:')
+    while start >= 0:
+        bracket = start + 5
+        while content[bracket:bracket + 1].isspace():
+            bracket += 1
+        if content.startswith('[', bracket):
+            close = content.find(']', bracket)
+            if close >= 0 and '\n' not in content[bracket:close]:
+                return start, close + 1, content[bracket + 1:close]
+        start = content.find('tags:', start + 1)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_documents(path: str, mtime_ns: int) -> Tuple[Any, ...]:
+    """Parse every YAML document in path; cached per modification time.
+
+    Callers share the returned objects and must not modify them.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return tuple(yaml.load_all(f, Loader=_YAML_LOADER))
+
+
+# (substring of a lowercased issue message, issue type tag); the first match wins
+_ISSUE_TYPE_NEEDLES = (
+    ("missing yaml frontmatter", "missing-frontmatter"),
+    ("missing frontmatter", "missing-frontmatter"),
+    ("missing required tag", "missing-required-tag"),
+    ("missing type/", "missing-type-tag"),
+    ("missing recommended tags", "missing-recommended-tags"),
+    ("inline array format", "tag-format-warning"),
+    ("missing block marker", "missing-block-marker"),
+    ("duplicate block marker", "duplicate-block-marker"),
+    ("incorrect block marker", "incorrect-block-marker"),
+    ("orphaned block marker", "orphaned-block-marker"),
+    ("dead block marker reference", "dead-block-reference"),
+    ("broken wikilink", "broken-wikilink"),
+    ("docstring", "docstring-issue"),
+    ("schema", "schema-violation"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_issue_message(message: str) -> str:
+    """Map an issue message to its issue type tag, ignoring case."""
+    message = message.lower()
+    for needle, issue_type in _ISSUE_TYPE_NEEDLES:
+        if needle in message:
+            return issue_type
+    return "other"
+
+
+# Write buffer for the summary report, which is streamed rather than built in memory
+REPORT_BUFFER_SIZE = 1 << 16
+
+# Issue filenames use dashes in place of spaces
+_SPACE_TO_DASH = str.maketrans({' ': '-'})
+
+# Directories never scanned (hidden and git-ignored paths are skipped as well)
+SKIPPED_DIRS = {'whiteboard'}
+
+# Threads used to overlap file reads (scanning) and writes (issue files)
+IO_WORKERS = 16
+
+# Changed files needed before validation is spread over worker processes;
+# below this, process startup costs more than it saves
+PROCESS_POOL_MIN_FILES = 64
+PROCESS_POOL_CHUNKSIZE = 32
+
+# Per-file results for unchanged clean files, reused by scan_repository
+SCAN_CACHE_NAME = '.janitor_cache.json'
+SCAN_CACHE_VERSION = 2
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes as strict UTF-8 with newlines normalized to LF.
+
+    Raises UnicodeDecodeError, which callers report as an unreadable file.
+    """
+    content = data.decode('utf-8')
+    if '\r' in content:
+        # Match read_text's universal newline handling
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _content_hash(content: str) -> str:
+    """Digest stored in the scan cache to recognise unchanged content under a new mtime."""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _git_listed_files(root: str) -> Optional[Tuple[Set[str], Set[str]]]:
+    """The files git would track under root, and the directories holding them.
+
+    Paths are root-relative and '/'-separated: tracked files plus untracked
+    ones not excluded by .gitignore or the other standard exclude files.
+    Returns None if git is not installed or root is not in a work tree.
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'ls-files', '-co', '--exclude-standard', '-z'],
+            cwd=root, capture_output=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    files = set(os.fsdecode(result.stdout).split('\0'))
+    files.discard('')
+    dirs = set()
+    for path in files:
+        slash = path.rfind('/')
+        while slash != -1 and path[:slash] not in dirs:
+            dirs.add(path[:slash])
+            slash = path.rfind('/', 0, slash)
+    return files, dirs
+
+
+def _walk_files(root: str, listed: Optional[Tuple[Set[str], Set[str]]] = None,
+                listings: Optional[Dict[str, Set[str]]] = None):
+    """Yield a DirEntry for every file under root, pruning hidden, skipped and ignored paths.
+
+    If listed is given, as returned by _git_listed_files, only the files it
+    names are yielded and directories holding none of them are pruned.
+    If listings is given, it receives the names of every non-symlink entry of
+    each directory scanned, pruned or not, keyed by directory path.
+    """
+    files, dirs = listed if listed is not None else (None, None)
+    stack: List[Tuple[str, str]] = [(root, '')]
+    while stack:
+        directory, prefix = stack.pop()
+        names = listings.setdefault(directory, set()) if listings is not None else None
+        with os.scandir(directory) as it:
+            for entry in it:
+                if names is not None and not entry.is_symlink():
+                    names.add(entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith('.') or entry.name in SKIPPED_DIRS:
+                        continue
+                    if dirs is not None and prefix + entry.name not in dirs:
+                        continue
+                    stack.append((entry.path, prefix + entry.name + '/'))
+                elif entry.is_file(follow_symlinks=False):
+                    if files is not None and prefix + entry.name not in files:
+                        continue
+                    yield entry
+
+
+@dataclass(slots=True)
+class FixRequest:
+    """An automatic fix to apply: RepositoryJanitor.fix_<kind>(filepath, content, *args)."""
+    kind: str
+    filepath: Path
+    args: Tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
 class Issue:
     """Represents a validation issue found in a file."""
     filepath: Path
@@ -35,21 +294,188 @@ class Issue:
     message: str
     fix_available: bool = False
     fix_description: str = ""
-    auto_fix_fn: Optional[callable] = None
+    auto_fix: Optional[FixRequest] = None
+    # Plain-string path pieces so report writers avoid per-issue pathlib work
+    name: str = ""
+    stem: str = ""
+    rel_path: str = ""  # Relative to vault root, filled in by RepositoryJanitor
+
+    def __post_init__(self):
+        path_str = os.fspath(self.filepath)
+        self.name = os.path.basename(path_str)
+        self.stem = os.path.splitext(self.name)[0]
+
+
+# Explanations attached to each issue file, keyed by issue type from
+# RepositoryJanitor._get_issue_type_tag (frontmatter issues also by file kind)
+_ISSUE_CONTEXTS = {
+    'missing-frontmatter-py': """**What's wrong**: This Python file lacks YAML frontmatter in its module docstring.
+
+**What's expected**: Python code files must have a module-level docstring that starts with YAML frontmatter containing tags. The frontmatter must include:
+- `type/code-file` tag (required)
+- At least one `domain/*` tag (recommended)
+- At least one `layer/*` tag (recommended)
+
+The docstring should follow this structure:
+1. YAML frontmatter with tags
+2. Module name header
+3. Purpose section
+4. Related documentation links
+5. Dependencies
+
+See CLAUDE.md for the complete schema.""",
+
+    'missing-frontmatter-md': """**What's wrong**: This markdown file lacks YAML frontmatter.
+
+**What's expected**: All markdown documentation files must start with YAML frontmatter containing tags. The frontmatter defines:
+- File type (type/concept, type/pattern, or type/index)
+- Domain tags indicating the problem domain
+- Layer tags indicating the architectural layer
+
+See CLAUDE.md for the complete schema and tag hierarchy.""",
+
+    'tag-format-warning': """**What's wrong**: Tags are using inline array format: `tags: [tag1, tag2, tag3]`
+
+**What's expected**: For better Obsidian compatibility, especially with hierarchical tags using slashes (like `type/concept`, `domain/mathematics`), use YAML list format:
+
+```yaml
+---
+tags:
+  - type/concept
+  - domain/mathematics
+  - layer/core
+---
+```
+
+**Why**: Obsidian's tag system works best with YAML list format for hierarchical tags. The inline array format may not properly parse nested tags with slashes.
+
+**How to fix**: Convert from:
+```yaml
+tags: [type/concept, domain/mathematics]
+```
+
+To:
+```yaml
+tags:
+  - type/concept
+  - domain/mathematics
+```""",
+
+    # Formatted with the tag name taken from the issue message
+    'missing-required-tag': """**What's wrong**: The file's frontmatter is missing the required tag: `{required_tag}`
+
+**What's expected**: Based on the file type, certain tags are mandatory:
+- Python files must have: `type/code-file`
+- Concept files must have: `type/concept`
+- Pattern files must have: `type/pattern`
+- Index files must have: `type/index`
+
+The tags array in the frontmatter must include this required tag.""",
+
+    'missing-type-tag': """**What's wrong**: The file has frontmatter but no `type/*` tag.
+
+**What's expected**: Every file must have exactly one type tag that categorizes it:
+- `type/code-file` - Python source code
+- `type/concept` - Conceptual/domain documentation
+- `type/pattern` - Design pattern documentation
+- `type/index` - Index or overview file
+
+The type tag determines what other required tags are needed.""",
+
+    'missing-recommended-tags': """**What's wrong**: The file meets minimum requirements but lacks recommended tags.
+
+**What's expected**: While not required, these tags improve organization:
+- `domain/*` - Indicates the problem domain (e.g., domain/mathematics, domain/ui)
+- `layer/*` - Indicates architectural layer (e.g., layer/core, layer/interface)
+- `pattern/*` - Indicates design patterns used (e.g., pattern/strategy)
+
+These tags enable better filtering and organization in Obsidian's graph view.""",
+}
+
+
+# Per-issue file written to whiteboard/janitor/
+_ISSUE_FILE_TEMPLATE = """---
+tags: [janitor-issue, janitor-issue/{issue_type}, severity/{severity}]
+---
+
+# Issue #{idx}: {name}
+
+**File**: [[{rel_path}|{name}]]
+
+**Severity**: {severity_upper}
+
+**Path**: `{rel_path}`
+
+## Problem
+
+{message}
+
+## Context
+
+{context}
+"""
+
+_ISSUE_FILE_FIX_NOTE_TEMPLATE = """
+## Note
+
+Auto-fix available: `{fix_description}`
+
+Run `python janitor.py --fix` to apply automatically.
+"""
+
+# Sections of whiteboard/janitor/00-summary.md, joined with blank lines
+_REPORT_HEADER_TEMPLATE = """---
+tags: [janitor-report, type/index]
+---
+
+# Janitor Report
+
+**Generated**: {generated}
+"""
+
+_REPORT_HEALTHY = """## Status
+
+**Repository is healthy!** No issues found.
+"""
+
+_REPORT_SUMMARY_TEMPLATE = """## Summary
+
+- **Errors**: {errors}
+- **Warnings**: {warnings}
+- **Total Issues**: {total}
+"""
+
+_REPORT_ISSUE_TEMPLATE = """### [[{rel_path}|{name}]]
+
+**File**: `{rel_path}`
+
+**Problem**: {message}
+"""
+
+_REPORT_FIX_NOTE = """
+**Auto-fix available**: Run `python janitor.py --fix`
+"""
 
 
 class RepositoryJanitor:
     """Validates and fixes repository structure and content."""
 
-    def __init__(self, vault_path: Path):
+    def __init__(self, vault_path: Path, on_issue: Optional[Callable[[Issue], None]] = None):
         self.vault_path = vault_path
         self.issues: List[Issue] = []
+        # Called with each issue as scan_repository finds it (e.g. to print progress)
+        self.on_issue = on_issue
         # Track all block markers across repository for reference validation
         self.block_markers: Dict[str, Tuple[Path, int]] = {}  # marker -> (file, lineno)
+        # Entries for one file share that file's Path object
         self.block_marker_references: List[Tuple[Path, int, str]] = []  # (file, line, marker)
 
-        # Track all wikilinks for link restriction validation
-        self.file_links: Dict[Path, List[Tuple[Path, int]]] = {}  # source -> [(target, lineno), ...]
+        # Wikilink check results per (source directory, link): the missing target, or None
+        self._wikilink_checks: Dict[Tuple[Path, str], Optional[Path]] = {}
+        # Entry names of every directory scan_repository walked, to resolve wikilinks without stats
+        self._dir_listings: Dict[str, Set[str]] = {}
+        # Resolved vault path, set by scan_repository along with the listings
+        self._vault_root: Optional[str] = None
 
         # Load schema from schema.yaml (scaffold base types)
         self.schema = self._load_schema()
@@ -65,18 +491,17 @@ class RepositoryJanitor:
             return {}
 
         try:
-            with open(schema_file, 'r', encoding='utf-8') as f:
-                # YAML file has multiple documents separated by ---
-                # We need to load all of them
-                schema_docs = list(yaml.safe_load_all(f))
-
-                # Combine all documents into single dict
-                combined = {}
-                for doc in schema_docs:
-                    if doc:
-                        combined.update(doc)
-
-                return combined
+            # YAML file has multiple documents separated by ---
+            # We need to load all of them
+            schema_docs = _load_yaml_documents(os.fspath(schema_file), schema_file.stat().st_mtime_ns)
+
+            # Combine all documents into single dict
+            combined = {}
+            for doc in schema_docs:
+                if doc:
+                    combined.update(doc)
+
+            return combined
         except Exception as e:
             print(f"ERROR: Failed to load schema.yaml: {e}")
             return {}
@@ -90,9 +515,10 @@ class RepositoryJanitor:
             return {}
 
         try:
-            with open(rules_file, 'r', encoding='utf-8') as f:
-                rules = yaml.safe_load(f)
-                return rules or {}
+            rules_docs = _load_yaml_documents(os.fspath(rules_file), rules_file.stat().st_mtime_ns)
+            if len(rules_docs) > 1:
+                raise yaml.YAMLError("expected a single document")
+            return (rules_docs[0] if rules_docs else None) or {}
         except Exception as e:
             print(f"WARNING: Failed to load project tag rules: {e}")
             return {}
@@ -126,6 +552,16 @@ class RepositoryJanitor:
         }
     }
 
+    # Set forms of REQUIRED_TAGS so validation is set arithmetic instead of nested loops
+    REQUIRED_TAG_SETS = {
+        file_type: frozenset(schema['required'])
+        for file_type, schema in REQUIRED_TAGS.items()
+    }
+    RECOMMENDED_PREFIXES = {
+        file_type: frozenset(p[:-2] for p in schema['recommended'] if p.endswith('/*'))
+        for file_type, schema in REQUIRED_TAGS.items()
+    }
+
     PYTHON_DOCSTRING_SCHEMA = """
 \"\"\"
 # Module Name
@@ -146,21 +582,32 @@ Brief description
 
     # ==================== PARSING UTILITIES ====================
 
+    def read_file(self, filepath: Path) -> str:
+        """Return file content with newlines normalized to LF."""
+        # One raw read and decode, skipping the text layer's buffering
+        return _decode_text(filepath.read_bytes())
+
     def parse_frontmatter(self, content: str) -> Tuple[Optional[Dict], str]:
         """Extract YAML frontmatter and return (frontmatter_dict, remaining_content)."""
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
+        if not content.startswith('---'):
+            return None, content
+        match = _FRONTMATTER_RE.match(content)
         if not match:
             return None, content
 
         yaml_content = match.group(1)
         remaining = match.group(2)
 
-        # Use yaml.safe_load to parse all YAML properties properly
-        try:
-            frontmatter = yaml.safe_load(yaml_content) or {}
-        except Exception:
-            # Fall back to old regex-based parsing if YAML parsing fails
-            frontmatter = {}
+        tags = _parse_tags_only_frontmatter(yaml_content)
+        if tags is not None:
+            frontmatter = {'tags': tags}
+        else:
+            # Safe-load to parse all YAML properties properly
+            try:
+                frontmatter = yaml.load(yaml_content, Loader=_YAML_LOADER) or {}
+            except Exception:
+                # Fall back to old regex-based parsing if YAML parsing fails
+                frontmatter = {}
 
         # Track tag format for validation
         yaml_content_check = yaml_content.replace('\n', ' ')
@@ -174,7 +621,7 @@ Brief description
     def extract_python_docstring(self, content: str) -> Optional[str]:
         """Extract the module-level docstring from Python file."""
         # Match triple-quoted docstring at start of file
-        match = re.match(r'^\s*"""(.*?)"""\s*\n', content, re.DOTALL)
+        match = _DOCSTRING_RE.match(content)
         if match:
             return match.group(1)
         return None
@@ -196,7 +643,7 @@ Brief description
         frontmatter = {}
 
         # Extract H1 module name
-        h1_match = re.search(r'^#\s+(.+)$', docstring, re.MULTILINE)
+        h1_match = _H1_RE.search(docstring)
         if h1_match:
             frontmatter['module_name'] = h1_match.group(1).strip()
 
@@ -208,48 +655,51 @@ Brief description
         all_tags = []
 
         # Try new format first (File Tags + Inheritable Tags)
-        file_tags_match = re.search(r'\*\*File Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
-        inheritable_tags_match = re.search(r'\*\*Inheritable Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
+        file_tags_match = _FILE_TAGS_RE.search(docstring)
+        inheritable_tags_match = _INHERITABLE_TAGS_RE.search(docstring)
 
         if file_tags_match or inheritable_tags_match:
             # New format detected
             if file_tags_match:
-                file_tags = re.findall(r'#([\w/.-]+)', file_tags_match.group(1))
+                file_tags = _HASHTAG_RE.findall(file_tags_match.group(1))
                 all_tags.extend(file_tags)
             if inheritable_tags_match:
-                inheritable_tags = re.findall(r'#([\w/.-]+)', inheritable_tags_match.group(1))
+                inheritable_tags = _HASHTAG_RE.findall(inheritable_tags_match.group(1))
                 all_tags.extend(inheritable_tags)
             frontmatter['_tag_format'] = 'split-tags'
         else:
             # Fallback to old format (**Tags**: #tag1 #tag2 #tag3)
-            tags_match = re.search(r'\*\*Tags\*\*:\s*(.+)$', docstring, re.MULTILINE)
+            tags_match = _TAGS_LINE_RE.search(docstring)
             if tags_match:
                 tags_line = tags_match.group(1)
-                all_tags = re.findall(r'#([\w/.-]+)', tags_line)
+                all_tags = _HASHTAG_RE.findall(tags_line)
                 frontmatter['_tag_format'] = 'inline-hashtags'
 
         if all_tags:
             frontmatter['tags'] = all_tags
 
         # Check for required sections
-        has_purpose = bool(re.search(r'^##\s+Purpose', docstring, re.MULTILINE))
+        has_purpose = bool(_PURPOSE_RE.search(docstring))
         frontmatter['has_purpose'] = has_purpose
 
         return frontmatter, docstring
 
-    def validate_block_markers(self, filepath: Path, content: str) -> None:
+    def validate_block_markers(self, filepath: Path, content: str,
+                               line_starts: Optional[List[int]] = None) -> Dict[str, int]:
         """Validate Obsidian block reference markers in Python file.
 
         Checks that:
         - Every function/class/method/constant has a block marker (# ^name)
         - Block marker naming is consistent with object name
         - No duplicate block IDs in same file
-        - Collects all markers for cross-reference validation
-        """
-        import ast
 
+        Pass line_starts when the caller already computed _line_starts(content).
+
+        Returns the file's markers (marker -> first lineno); callers register
+        them for cross-reference validation.
+        """
         try:
-            tree = ast.parse(content, filename=str(filepath))
+            tree = ast.parse(content, filename=str(filepath), type_comments=False)
         except SyntaxError as e:
             self.issues.append(Issue(
                 filepath=filepath,
@@ -257,108 +707,80 @@ Brief description
                 message=f"Syntax error in Python file: {e}",
                 fix_available=False
             ))
-            return
+            return {}
 
-        lines = content.split('\n')
+        if line_starts is None:
+            line_starts = _line_starts(content)
 
         # Extract all block markers from file (for duplicate detection and registry)
-        file_markers = {}
-        for lineno, line in enumerate(lines, 1):
-            marker_match = re.search(r'#\s*\^(\S+)', line)
-            if marker_match:
+        file_markers: Dict[str, int] = {}
+        previous_lineno = 0
+        for marker_match in _BLOCK_MARKER_RE.finditer(content):
+            lineno = bisect.bisect_right(line_starts, marker_match.start())
+            if lineno != previous_lineno:  # Only the first marker on a line counts
+                previous_lineno = lineno
                 marker = marker_match.group(1)
 
                 # Check for duplicates within this file
-                if marker in file_markers:
+                first_lineno = file_markers.setdefault(marker, lineno)
+                if first_lineno != lineno:
                     self.issues.append(Issue(
                         filepath=filepath,
                         severity='error',
-                        message=f"Duplicate block marker ^{marker} in same file (lines {file_markers[marker]} and {lineno})",
+                        message=f"Duplicate block marker ^{marker} in same file (lines {first_lineno} and {lineno})",
                         fix_available=False
                     ))
-                else:
-                    file_markers[marker] = lineno
-
-                    # Check for duplicates across entire repository
-                    # CHANGED: Duplicate markers across files are now allowed (e.g., PLUGIN_OPERATIONS in multiple plugins)
-                    # Only register the FIRST occurrence for reference validation
-                    if marker not in self.block_markers:
-                        # Register this marker globally
-                        self.block_markers[marker] = (filepath, lineno)
 
         # Track which objects we've found to detect orphaned markers
         expected_markers = set()
 
-        # Check all functions, classes, methods, and constants have markers
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Determine expected marker name
-                parent_class = None
-                for parent in ast.walk(tree):
-                    if isinstance(parent, ast.ClassDef):
-                        if node in parent.body:
-                            parent_class = parent.name
-                            break
-
-                if parent_class:
-                    expected_marker = f"{parent_class}-{node.name}"
-                    obj_desc = f"method {parent_class}.{node.name}"
-                else:
-                    expected_marker = node.name
-                    obj_desc = f"function {node.name}"
-
-                expected_markers.add(expected_marker)
+        def check_marker(lineno: int, expected_marker: str, obj_desc: str,
+                         severity: str, check_name: bool) -> None:
+            """Report a missing (or, with check_name, misnamed) marker on an object's line."""
+            expected_markers.add(expected_marker)
+            if lineno > len(line_starts):
+                return
 
-                # Check if marker exists on this line
-                if node.lineno <= len(lines):
-                    line = lines[node.lineno - 1]
-                    if f"# ^{expected_marker}" not in line:
+            line = _line_at(content, line_starts, lineno)
+            if f"# ^{expected_marker}" not in line:
+                self.issues.append(Issue(
+                    filepath=filepath,
+                    severity=severity,
+                    message=f"Missing block marker for {obj_desc} at line {lineno}. Expected: # ^{expected_marker}",
+                    fix_available=False
+                ))
+            elif check_name:
+                # Verify the marker name is exactly correct
+                marker_match = _BLOCK_MARKER_RE.search(line)
+                if marker_match:
+                    actual_marker = marker_match.group(1)
+                    if actual_marker != expected_marker:
                         self.issues.append(Issue(
                             filepath=filepath,
-                            severity='error',
-                            message=f"Missing block marker for {obj_desc} at line {node.lineno}. Expected: # ^{expected_marker}",
+                            severity=severity,
+                            message=f"Incorrect block marker for {obj_desc} at line {lineno}. Found ^{actual_marker}, expected ^{expected_marker}",
                             fix_available=False
                         ))
-                    else:
-                        # Verify the marker name is exactly correct
-                        marker_match = re.search(r'#\s*\^(\S+)', line)
-                        if marker_match:
-                            actual_marker = marker_match.group(1)
-                            if actual_marker != expected_marker:
-                                self.issues.append(Issue(
-                                    filepath=filepath,
-                                    severity='error',
-                                    message=f"Incorrect block marker for {obj_desc} at line {node.lineno}. Found ^{actual_marker}, expected ^{expected_marker}",
-                                    fix_available=False
-                                ))
+
+        # Class of each node directly in a class body; the walk is breadth-first,
+        # so a class is always recorded before its methods are reached
+        method_class: Dict[int, str] = {}
+
+        # Check all functions, classes, methods, and constants have markers
+        for node in _walk_statements(tree):
+            if isinstance(node, ast.FunctionDef):
+                # Determine expected marker name
+                parent_class = method_class.get(id(node))
+                if parent_class:
+                    check_marker(node.lineno, f"{parent_class}-{node.name}",
+                                 f"method {parent_class}.{node.name}", 'error', True)
+                else:
+                    check_marker(node.lineno, node.name, f"function {node.name}", 'error', True)
 
             elif isinstance(node, ast.ClassDef):
-                expected_marker = node.name
-                obj_desc = f"class {node.name}"
-                expected_markers.add(expected_marker)
-
-                # Check if marker exists on this line
-                if node.lineno <= len(lines):
-                    line = lines[node.lineno - 1]
-                    if f"# ^{expected_marker}" not in line:
-                        self.issues.append(Issue(
-                            filepath=filepath,
-                            severity='error',
-                            message=f"Missing block marker for {obj_desc} at line {node.lineno}. Expected: # ^{expected_marker}",
-                            fix_available=False
-                        ))
-                    else:
-                        # Verify the marker name is exactly correct
-                        marker_match = re.search(r'#\s*\^(\S+)', line)
-                        if marker_match:
-                            actual_marker = marker_match.group(1)
-                            if actual_marker != expected_marker:
-                                self.issues.append(Issue(
-                                    filepath=filepath,
-                                    severity='error',
-                                    message=f"Incorrect block marker for {obj_desc} at line {node.lineno}. Found ^{actual_marker}, expected ^{expected_marker}",
-                                    fix_available=False
-                                ))
+                for child in node.body:
+                    method_class[id(child)] = node.name
+                check_marker(node.lineno, node.name, f"class {node.name}", 'error', True)
 
             elif isinstance(node, ast.Assign):
                 # Check module-level constants (ALL_CAPS)
@@ -366,46 +788,30 @@ Brief description
                     if isinstance(target, ast.Name):
                         name = target.id
                         if name.isupper() and len(name) > 1:
-                            expected_marker = name
-                            obj_desc = f"constant {name}"
-                            expected_markers.add(expected_marker)
-
-                            # Check if marker exists on this line
-                            if node.lineno <= len(lines):
-                                line = lines[node.lineno - 1]
-                                if f"# ^{expected_marker}" not in line:
-                                    self.issues.append(Issue(
-                                        filepath=filepath,
-                                        severity='warning',
-                                        message=f"Missing block marker for {obj_desc} at line {node.lineno}. Expected: # ^{expected_marker}",
-                                        fix_available=False
-                                    ))
+                            check_marker(node.lineno, name, f"constant {name}", 'warning', False)
 
         # Check for orphaned markers (markers that don't correspond to any object)
-        for marker in file_markers.keys():
+        for marker, lineno in file_markers.items():
             if marker not in expected_markers:
                 self.issues.append(Issue(
                     filepath=filepath,
                     severity='warning',
-                    message=f"Orphaned block marker ^{marker} at line {file_markers[marker]} does not correspond to any function/class/constant",
+                    message=f"Orphaned block marker ^{marker} at line {lineno} does not correspond to any function/class/constant",
                     fix_available=False
                 ))
 
+        return file_markers
+
     # ==================== VALIDATION FUNCTIONS ====================
 
-    def validate_python_file(self, filepath: Path) -> None:
-        """Validate a Python code file."""
-        try:
-            content = filepath.read_text(encoding='utf-8')
-        except Exception as e:
-            self.issues.append(Issue(
-                filepath=filepath,
-                severity='error',
-                message=f"Could not read file: {e}",
-                fix_available=False
-            ))
-            return
+    def validate_python_file(self, filepath: Path, content: str,
+                             line_starts: Optional[List[int]] = None) -> Dict[str, int]:
+        """Validate a Python code file given its content.
+
+        line_starts is passed on to validate_block_markers.
 
+        Returns the file's block markers (empty if validation stopped early).
+        """
         # Extract docstring
         docstring = self.extract_python_docstring(content)
         if not docstring:
@@ -415,9 +821,9 @@ Brief description
                 message="Missing module-level docstring",
                 fix_available=True,
                 fix_description="Add template docstring with frontmatter",
-                auto_fix_fn=lambda: self.fix_add_python_docstring(filepath)
+                auto_fix=FixRequest('add_python_docstring', filepath)
             ))
-            return
+            return {}
 
         # Parse custom frontmatter from docstring (Python-specific format)
         frontmatter, _ = self.parse_python_custom_frontmatter(docstring)
@@ -428,7 +834,7 @@ Brief description
                 message="Docstring missing custom frontmatter (needs # Module Name and **Tags**: line)",
                 fix_available=False
             ))
-            return
+            return {}
 
         # Check for H1 module name
         if not frontmatter.get('module_name'):
@@ -447,7 +853,7 @@ Brief description
                 message="Docstring missing tags (need either **Tags**: OR **File Tags**:/**Inheritable Tags**: with #hashtags)",
                 fix_available=False
             ))
-            return
+            return {}
 
         # Check for Purpose section
         if not frontmatter.get('has_purpose'):
@@ -462,25 +868,19 @@ Brief description
         tags = set(frontmatter.get('tags', []))
         schema = self.REQUIRED_TAGS['code-file']
 
-        for required_tag in schema['required']:
-            if required_tag not in tags:
-                self.issues.append(Issue(
-                    filepath=filepath,
-                    severity='error',
-                    message=f"Missing required tag: {required_tag}",
-                    fix_available=True,
-                    fix_description=f"Add '{required_tag}' to tags",
-                    auto_fix_fn=lambda tag=required_tag: self.fix_add_tag(filepath, tag)
-                ))
+        for required_tag in sorted(self.REQUIRED_TAG_SETS['code-file'] - tags):
+            self.issues.append(Issue(
+                filepath=filepath,
+                severity='error',
+                message=f"Missing required tag: {required_tag}",
+                fix_available=True,
+                fix_description=f"Add '{required_tag}' to tags",
+                auto_fix=FixRequest('add_tag', filepath, (required_tag,))
+            ))
 
         # Check recommended tags (warnings only)
-        has_recommended = False
-        for rec_pattern in schema['recommended']:
-            if rec_pattern.endswith('/*'):
-                prefix = rec_pattern[:-2]
-                has_recommended = any(t.startswith(prefix + '/') for t in tags)
-                if has_recommended:
-                    break
+        tag_prefixes = {t.split('/', 1)[0] for t in tags if '/' in t}
+        has_recommended = not self.RECOMMENDED_PREFIXES['code-file'].isdisjoint(tag_prefixes)
 
         if not has_recommended and schema['recommended']:
             self.issues.append(Issue(
@@ -491,21 +891,10 @@ Brief description
             ))
 
         # Validate block markers
-        self.validate_block_markers(filepath, content)
-
-    def validate_markdown_file(self, filepath: Path) -> None:
-        """Validate a markdown documentation file."""
-        try:
-            content = filepath.read_text(encoding='utf-8')
-        except Exception as e:
-            self.issues.append(Issue(
-                filepath=filepath,
-                severity='error',
-                message=f"Could not read file: {e}",
-                fix_available=False
-            ))
-            return
+        return self.validate_block_markers(filepath, content, line_starts)
 
+    def validate_markdown_file(self, filepath: Path, content: str) -> None:
+        """Validate a markdown documentation file given its content."""
         # Parse frontmatter
         frontmatter, _ = self.parse_frontmatter(content)
         if not frontmatter:
@@ -515,7 +904,7 @@ Brief description
                 message="Missing YAML frontmatter",
                 fix_available=True,
                 fix_description="Add frontmatter with tags",
-                auto_fix_fn=lambda: self.fix_add_markdown_frontmatter(filepath)
+                auto_fix=FixRequest('add_markdown_frontmatter', filepath)
             ))
             return
 
@@ -528,13 +917,13 @@ Brief description
                 fix_available=False
             ))
 
-        # Determine file type from tags
-        tags = set(frontmatter.get('tags', []))
+        # Collect the tag set and file type in a single pass over the tags
+        tags = set()
         file_type = None
-        for tag in tags:
-            if tag.startswith('type/'):
-                file_type = tag.split('/', 1)[1]
-                break
+        for tag in frontmatter.get('tags', []):
+            tags.add(tag)
+            if file_type is None and tag.startswith('type/'):
+                file_type = tag[5:]
 
         if not file_type:
             self.issues.append(Issue(
@@ -546,25 +935,28 @@ Brief description
             return
 
         # Validate against schema
-        if file_type in self.REQUIRED_TAGS:
-            schema = self.REQUIRED_TAGS[file_type]
-            for required_tag in schema['required']:
-                if required_tag not in tags:
-                    self.issues.append(Issue(
-                        filepath=filepath,
-                        severity='error',
-                        message=f"Missing required tag: {required_tag}",
-                        fix_available=True,
-                        fix_description=f"Add '{required_tag}' to tags",
-                        auto_fix_fn=lambda tag=required_tag: self.fix_add_tag(filepath, tag)
-                    ))
+        if file_type in self.REQUIRED_TAG_SETS:
+            for required_tag in sorted(self.REQUIRED_TAG_SETS[file_type] - tags):
+                self.issues.append(Issue(
+                    filepath=filepath,
+                    severity='error',
+                    message=f"Missing required tag: {required_tag}",
+                    fix_available=True,
+                    fix_description=f"Add '{required_tag}' to tags",
+                    auto_fix=FixRequest('add_tag', filepath, (required_tag,))
+                ))
 
         # NEW: Validate project-specific tag property requirements
-        self.validate_tag_properties(filepath, frontmatter)
+        self.validate_tag_properties(filepath, frontmatter, tags)
 
-    def validate_tag_properties(self, filepath: Path, frontmatter: dict) -> None:
-        """Validate that files with project-defined tags have required properties."""
-        tags = set(frontmatter.get('tags', []))
+    def validate_tag_properties(self, filepath: Path, frontmatter: dict,
+                                tags: Optional[Set[str]] = None) -> None:
+        """Validate that files with project-defined tags have required properties.
+
+        Pass tags when the caller already built the file's tag set.
+        """
+        if tags is None:
+            tags = set(frontmatter.get('tags', []))
 
         # Skip project tag validation for auto-generated files
         # These files may have many tags for graph purposes but aren't "real" instances of those tags
@@ -587,7 +979,7 @@ Brief description
                             message=f"Tag '{required_tag}' requires property '{prop}' in frontmatter",
                             fix_available=True,
                             fix_description=f"Add '{prop}: FIXME' to frontmatter",
-                            auto_fix_fn=lambda p=prop: self.fix_add_property(filepath, p, 'FIXME')
+                            auto_fix=FixRequest('add_property', filepath, (prop, 'FIXME'))
                         ))
 
                 # Validate property patterns (if defined)
@@ -604,10 +996,11 @@ Brief description
 
     # ==================== FIX FUNCTIONS ====================
 
-    def fix_add_python_docstring(self, filepath: Path) -> bool:
-        """Add template docstring to Python file."""
-        content = filepath.read_text(encoding='utf-8')
+    # Each fix takes the file's current content and returns the fixed content,
+    # or None if it cannot be applied; apply_fixes does the reading and writing
 
+    def fix_add_python_docstring(self, filepath: Path, content: str) -> Optional[str]:
+        """Add template docstring to Python file."""
         template = '''"""
 ---
 tags: [type/code-file, domain/FIXME, layer/FIXME]
@@ -627,17 +1020,15 @@ TODO: Brief description of what this module does.
 
 '''.format(filepath.stem.replace('_', ' ').title())
 
-        new_content = template + content
-        filepath.write_text(new_content, encoding='utf-8')
-        return True
+        return template + content
 
-    def fix_add_frontmatter_to_docstring(self, filepath: Path) -> bool:
+    def fix_add_frontmatter_to_docstring(self, filepath: Path, content: str) -> Optional[str]:
         """Add frontmatter to existing docstring."""
-        content = filepath.read_text(encoding='utf-8')
-        docstring = self.extract_python_docstring(content)
+        match = _DOCSTRING_RE.match(content)
+        docstring = match.group(1) if match else None
 
         if not docstring:
-            return False
+            return None
 
         # Add frontmatter at start of docstring
         frontmatter = '''---
@@ -647,70 +1038,49 @@ tags: [type/code-file, domain/FIXME, layer/FIXME]
 '''
         new_docstring = frontmatter + docstring.lstrip()
 
-        # Replace old docstring with new one
-        new_content = re.sub(
-            r'^\s*"""(.*?)"""\s*\n',
-            f'"""{new_docstring}"""\n',
-            content,
-            count=1,
-            flags=re.DOTALL
-        )
+        # Replace old docstring with new one, splicing at the matched span
+        return f'"""{new_docstring}"""\n' + content[match.end():]
 
-        filepath.write_text(new_content, encoding='utf-8')
-        return True
-
-    def fix_add_tag(self, filepath: Path, tag: str) -> bool:
+    def fix_add_tag(self, filepath: Path, content: str, tag: str) -> Optional[str]:
         """Add a tag to file's frontmatter."""
-        content = filepath.read_text(encoding='utf-8')
-
         # Find and update the tags line
-        def add_tag_to_line(match):
-            tags_content = match.group(1)
-            # Parse existing tags
-            existing_tags = [t.strip().strip('"').strip("'") for t in tags_content.split(',')]
-            if tag not in existing_tags:
-                existing_tags.append(tag)
-            # Rebuild tags line
-            tags_str = ', '.join(existing_tags)
-            return f'tags: [{tags_str}]'
-
-        new_content = re.sub(r'tags:\s*\[(.*?)\]', add_tag_to_line, content, count=1)
-        filepath.write_text(new_content, encoding='utf-8')
-        return True
-
-    def fix_add_markdown_frontmatter(self, filepath: Path) -> bool:
+        inline_tags = _find_inline_tags(content)
+        if not inline_tags:
+            return content
+
+        start, end, tags_content = inline_tags
+        # Parse existing tags
+        existing_tags = [t.strip(' \t"\'') for t in tags_content.split(',')]
+        if tag not in existing_tags:
+            existing_tags.append(tag)
+        # Rebuild tags line
+        return f"{content[:start]}tags: [{', '.join(existing_tags)}]{content[end:]}"
+
+    def fix_add_markdown_frontmatter(self, filepath: Path, content: str) -> Optional[str]:
         """Add frontmatter to markdown file."""
-        content = filepath.read_text(encoding='utf-8')
-
         frontmatter = '''---
 tags: [type/FIXME]
 ---
 
 '''
-        new_content = frontmatter + content
-        filepath.write_text(new_content, encoding='utf-8')
-        return True
+        return frontmatter + content
 
-    def fix_add_property(self, filepath: Path, property_name: str, default_value: str) -> bool:
+    def fix_add_property(self, filepath: Path, content: str,
+                         property_name: str, default_value: str) -> Optional[str]:
         """Add a missing property to YAML frontmatter."""
-        content = filepath.read_text(encoding='utf-8')
-
         if not content.startswith('---'):
-            return False
+            return None
 
         parts = content.split('---', 2)
         if len(parts) < 3:
-            return False
+            return None
 
         fm_content = parts[1]
         body = parts[2]
 
         # Add property to frontmatter (YAML format)
         new_fm = fm_content.rstrip() + f"\n{property_name}: {default_value}\n"
-        new_content = f"---{new_fm}---{body}"
-
-        filepath.write_text(new_content, encoding='utf-8')
-        return True
+        return f"---{new_fm}---{body}"
 
     # ==================== MAIN EXECUTION ====================
 
@@ -721,21 +1091,28 @@ tags: [type/FIXME]
         - [[file.py#^marker|Display]]
         - [[../code/file.py#^marker]]
         """
-        lines = content.split('\n')
-
-        # Pattern to match [[file#^marker]] or [[file#^marker|display]]
-        pattern = r'\[\[([^\]]+?)#\^([^\]|]+)(?:\|[^\]]+)?\]\]'
-
-        for lineno, line in enumerate(lines, 1):
-            for match in re.finditer(pattern, line):
-                referenced_file = match.group(1)
-                marker = match.group(2)
-                self.block_marker_references.append((filepath, lineno, marker))
+        for lineno, marker in self.find_block_marker_references(content):
+            self.block_marker_references.append((filepath, lineno, marker))
+
+    def find_block_marker_references(self, content: str,
+                                     line_starts: Optional[List[int]] = None) -> List[Tuple[int, str]]:
+        """Return (lineno, marker) for every block marker reference in content."""
+        if '#^' not in content:
+            return []
+        if line_starts is None:
+            line_starts = _line_starts(content)
+        return [(bisect.bisect_right(line_starts, match.start()), match.group(2))
+                for match in _BLOCK_REF_RE.finditer(content)]
 
     def validate_all_block_marker_references(self) -> None:
         """Validate that all block marker references point to existing markers."""
+        # Many references share a marker, so find the dead ones with one set difference
+        dead = {marker for _, _, marker in self.block_marker_references} - self.block_markers.keys()
+        if not dead:
+            return
+
         for ref_file, ref_line, marker in self.block_marker_references:
-            if marker not in self.block_markers:
+            if marker in dead:
                 self.issues.append(Issue(
                     filepath=ref_file,
                     severity='error',
@@ -754,26 +1131,42 @@ tags: [type/FIXME]
         - [[file#^marker]]
         - [[file#^marker|Display]]
         """
-        lines = content.split('\n')
-
-        # Pattern to match [[link]] or [[link|display]]
-        # Captures: [[path/to/file#section|display text]]
-        pattern = r'\[\[([^\]|#]+)(?:#[^\]|]+)?(?:\|[^\]]+)?\]\]'
-
-        for lineno, line in enumerate(lines, 1):
-            for match in re.finditer(pattern, line):
-                link_path = match.group(1).strip()
-
+        self.check_wikilinks(filepath, self.find_wikilinks(content))
+
+    def find_wikilinks(self, content: str,
+                       line_starts: Optional[List[int]] = None) -> List[Tuple[int, str]]:
+        """Return (lineno, link_path) for every wikilink in content."""
+        if '[[' not in content:
+            return []
+        if line_starts is None:
+            line_starts = _line_starts(content)
+        return [(bisect.bisect_right(line_starts, match.start()), match.group(1).strip())
+                for match in _WIKILINK_RE.finditer(content)]
+
+    def check_wikilinks(self, filepath: Path, links: List[Tuple[int, str]]) -> None:
+        """Report wikilinks from filepath whose target file does not exist.
+
+        Resolution only depends on the source directory, so each (directory, link)
+        pair is resolved and checked once however many files share it.
+        """
+        source_dir = filepath.parent
+        for lineno, link_path in links:
+            key = (source_dir, link_path)
+            try:
+                missing_target = self._wikilink_checks[key]
+            except KeyError:
                 # Resolve the link path relative to the source file
                 target_path = self._resolve_wikilink(filepath, link_path)
+                missing_target = self._wikilink_checks[key] = (
+                    target_path if target_path and not self._path_exists(target_path) else None)
 
-                if target_path and not target_path.exists():
-                    self.issues.append(Issue(
-                        filepath=filepath,
-                        severity='error',
-                        message=f"Broken wikilink at line {lineno}: [[{link_path}]] -> {target_path} does not exist",
-                        fix_available=False
-                    ))
+            if missing_target is not None:
+                self.issues.append(Issue(
+                    filepath=filepath,
+                    severity='error',
+                    message=f"Broken wikilink at line {lineno}: [[{link_path}]] -> {missing_target} does not exist",
+                    fix_available=False
+                ))
 
     def _resolve_wikilink(self, source_file: Path, link: str) -> Optional[Path]:
         """Resolve a wikilink to an absolute path.
@@ -788,293 +1181,441 @@ tags: [type/FIXME]
         # Handle relative paths (contain ../ or ./)
         if link.startswith('../') or link.startswith('./'):
             # Relative to the source file's directory
-            resolved = (source_file.parent / link).resolve()
-            return resolved
+            return self._resolve_path(source_file.parent, link)
 
         # Handle absolute-looking paths that start from vault root
         if '/' in link:
             # Treat as path from vault root
-            resolved = (self.vault_path / link).resolve()
-            return resolved
+            return self._resolve_path(self.vault_path, link)
+
+        # Plain filename - the first existing candidate wins. The directory
+        # listings from the scan answer nearly every lookup; disk is only probed
+        # when they have no match (e.g. unscanned directories, symlinks or
+        # case-insensitive filesystems)
+        candidates = self._wikilink_candidates(source_file.parent, link)
+        for exists in (self._is_listed, Path.exists):
+            for candidate in candidates:
+                if exists(candidate):
+                    return self._resolve_path(candidate.parent, candidate.name)
 
-        # Plain filename - search in multiple locations
-        # 1. Same directory as source
-        same_dir = source_file.parent / link
-        if not link.endswith('.md') and not link.endswith('.py'):
-            # Try adding .md extension for markdown files
-            same_dir_md = source_file.parent / f"{link}.md"
-            if same_dir_md.exists():
-                return same_dir_md.resolve()
+        # If we get here, return the "expected" path for error reporting
+        # Default to same directory if no extension, otherwise use as-is
+        if '.' not in link:
+            return source_file.parent / f"{link}.md"
+        return source_file.parent / link
 
-        if same_dir.exists():
-            return same_dir.resolve()
+    def _wikilink_candidates(self, source_dir: Path, link: str) -> List[Path]:
+        """Paths a plain-filename wikilink may refer to, in lookup order."""
+        candidates = []
+        # 1. Same directory as source (trying the .md extension for markdown files first)
+        if not link.endswith('.md') and not link.endswith('.py'):
+            candidates.append(source_dir / f"{link}.md")
+        candidates.append(source_dir / link)
 
         # 2. obsidian/ directory for concept/pattern files
-        obsidian_path = self.vault_path / 'obsidian' / link
         if not link.endswith('.md'):
-            obsidian_path_md = self.vault_path / 'obsidian' / f"{link}.md"
-            if obsidian_path_md.exists():
-                return obsidian_path_md.resolve()
-
-        if obsidian_path.exists():
-            return obsidian_path.resolve()
+            candidates.append(self.vault_path / 'obsidian' / f"{link}.md")
+        candidates.append(self.vault_path / 'obsidian' / link)
 
         # 3. code/ directory for Python files
-        code_path = self.vault_path / 'code' / link
         if not link.endswith('.py'):
-            code_path_py = self.vault_path / 'code' / f"{link}.py"
-            if code_path_py.exists():
-                return code_path_py.resolve()
-
-        if code_path.exists():
-            return code_path.resolve()
+            candidates.append(self.vault_path / 'code' / f"{link}.py")
+        candidates.append(self.vault_path / 'code' / link)
 
         # 4. Vault root for files like CLAUDE.md, schema.yaml, update.py
-        root_path = self.vault_path / link
-        if root_path.exists():
-            return root_path.resolve()
+        candidates.append(self.vault_path / link)
+        return candidates
 
-        # If we get here, return the "expected" path for error reporting
-        # Default to same directory if no extension, otherwise use as-is
-        if '.' not in link:
-            return source_file.parent / f"{link}.md"
-        return source_file.parent / link
-
-    def scan_repository(self) -> None:
-        """Scan all files in the repository."""
-        # Phase 1: Scan Python files and collect block markers
-        for py_file in (self.vault_path / 'code').rglob('*.py'):
-            self.validate_python_file(py_file)
+    def _is_listed(self, path: Union[Path, str]) -> bool:
+        """Whether the scan saw path as an entry of a directory it walked."""
+        directory, name = os.path.split(os.fspath(path))
+        names = self._dir_listings.get(directory)
+        return names is not None and name in names
 
-            # Extract wikilinks from Python docstrings
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                self.extract_wikilinks(py_file, content)
-            except Exception:
-                pass  # Already reported in validate_python_file
+    def _resolve_path(self, base: Path, rel: str) -> Path:
+        """Return (base / rel).resolve(), without disk access inside scanned directories.
 
-        # Phase 2: Scan markdown files and collect block marker references
-        for md_file in self.vault_path.rglob('*.md'):
-            # Skip hidden directories and whiteboard folder
-            if any(part.startswith('.') for part in md_file.parts):
+        The scan walks real directories only, never symlinks, so within them
+        '.' and '..' apply lexically and the result maps onto the resolved vault.
+        """
+        vault_str = os.fspath(self.vault_path)
+        path = os.fspath(base)
+        for part in rel.split('/'):
+            if part in ('', '.'):
                 continue
-            if 'whiteboard' in md_file.parts:
+            if path not in self._dir_listings:
+                return (base / rel).resolve()
+            path = os.path.dirname(path) if part == '..' else os.path.join(path, part)
+
+        if path not in self._dir_listings and not self._is_listed(path):
+            return (base / rel).resolve()
+        return Path(self._vault_root + path[len(vault_str):])
+
+    def _path_exists(self, path: Path) -> bool:
+        """Path.exists, answered from the scan's directory listings where possible."""
+        return self._is_listed(path) or path.exists()
+
+    def scan_repository(self, use_cache: bool = True) -> None:
+        """Scan all files in the repository.
+
+        Files that were clean on the previous run and have not changed since
+        skip validation: their block markers, block references and wikilinks
+        are replayed from the scan cache, so cross-file checks still run.
+        A file is unchanged if its mtime and size match, or failing that if
+        its content hash does. With use_cache=False every file is validated
+        and the cache is only rewritten.
+        """
+        # Discover Python (code/ only) and markdown files in a single walk
+        vault_str = os.fspath(self.vault_path)
+        code_prefix = os.path.join(vault_str, 'code') + os.sep
+        python_files: List[Path] = []
+        markdown_files: List[Path] = []
+        stamps: Dict[Path, List[int]] = {}
+        self._vault_root = os.path.realpath(vault_str)
+        for entry in _walk_files(vault_str, _git_listed_files(vault_str), self._dir_listings):
+            if entry.name.endswith('.py'):
+                if not entry.path.startswith(code_prefix):
+                    continue
+                filepath = Path(entry.path)
+                python_files.append(filepath)
+            elif entry.name.endswith('.md'):
+                filepath = Path(entry.path)
+                markdown_files.append(filepath)
+            else:
                 continue
-
-            # Validate markdown file
-            self.validate_markdown_file(md_file)
-
-            # Extract block marker references and wikilinks
-            try:
-                content = md_file.read_text(encoding='utf-8')
-                self.extract_block_marker_references(md_file, content)
-                self.extract_wikilinks(md_file, content)
-            except Exception:
-                pass  # Already reported in validate_markdown_file
-
-        # Phase 3: Validate all block marker references resolve
-        self.validate_all_block_marker_references()
-
-    def _get_issue_type_tag(self, issue: Issue) -> str:
-        """Determine issue type tag based on the problem."""
-        message = issue.message.lower()
-
-        if "missing yaml frontmatter" in message or "missing frontmatter" in message:
-            return "missing-frontmatter"
-        elif "missing required tag" in message:
-            return "missing-required-tag"
-        elif "missing type/" in message:
-            return "missing-type-tag"
-        elif "missing recommended tags" in message:
-            return "missing-recommended-tags"
-        elif "inline array format" in message:
-            return "tag-format-warning"
-        elif "missing block marker" in message:
-            return "missing-block-marker"
-        elif "duplicate block marker" in message:
-            return "duplicate-block-marker"
-        elif "incorrect block marker" in message:
-            return "incorrect-block-marker"
-        elif "orphaned block marker" in message:
-            return "orphaned-block-marker"
-        elif "dead block marker reference" in message:
-            return "dead-block-reference"
-        elif "broken wikilink" in message:
-            return "broken-wikilink"
-        elif "docstring" in message:
-            return "docstring-issue"
-        elif "schema" in message:
-            return "schema-violation"
-        else:
-            return "other"
-
-    def _get_issue_context(self, issue: Issue) -> str:
-        """Provide context about what's wrong and what's expected."""
-        message = issue.message.lower()
-
-        if "missing yaml frontmatter" in message:
-            if issue.filepath.suffix == '.py':
-                return """**What's wrong**: This Python file lacks YAML frontmatter in its module docstring.
-
-**What's expected**: Python code files must have a module-level docstring that starts with YAML frontmatter containing tags. The frontmatter must include:
-- `type/code-file` tag (required)
-- At least one `domain/*` tag (recommended)
-- At least one `layer/*` tag (recommended)
-
-The docstring should follow this structure:
-1. YAML frontmatter with tags
-2. Module name header
-3. Purpose section
-4. Related documentation links
-5. Dependencies
-
-See CLAUDE.md for the complete schema."""
+            st = entry.stat()
+            stamps[filepath] = [st.st_mtime_ns, st.st_size]
+
+        cached_files = self._load_scan_cache() if use_cache else {}
+        new_cache: Dict[str, Dict[str, Any]] = {}
+        cache_hits: Dict[Path, Dict[str, Any]] = {}
+        for filepath, stamp in stamps.items():
+            key = os.fspath(filepath)
+            cached = cached_files.get(key)
+            if cached is not None and cached.get('stamp') == stamp:
+                cache_hits[filepath] = new_cache[key] = cached
+
+        # Read everything up front so disk I/O overlaps instead of serializing
+        to_read = [f for f in python_files + markdown_files if f not in cache_hits]
+        contents = dict(zip(to_read, self._read_files(to_read)))
+        hashes = {f: _content_hash(c) for f, c in contents.items()
+                  if not isinstance(c, Exception)}
+
+        # Touched but unchanged files (checkouts, editor saves) still hit on content
+        for filepath, digest in hashes.items():
+            cached = cached_files.get(os.fspath(filepath))
+            if cached is not None and cached.get('hash') == digest:
+                cached['stamp'] = stamps[filepath]
+                cache_hits[filepath] = new_cache[os.fspath(filepath)] = cached
+
+        # Validate changed files; results arrive in job order, which is also
+        # discovery order, so they are merged as soon as each is ready
+        jobs = [(f, contents[f]) for f in to_read if f in hashes and f not in cache_hits]
+        results = self._validate_files(jobs)
+
+        # Phases 1 and 2: Python files provide block markers, markdown files
+        # collect block marker references; both have their wikilinks checked
+        file_markers: List[Tuple[Path, Any]] = []  # (file, (marker, lineno) pairs)
+        reported = 0
+        for filepath in python_files + markdown_files:
+            cached = cache_hits.get(filepath)
+            if cached is not None:
+                file_markers.append((filepath, cached['markers']))
+                self._replay_cached_file(filepath, cached)
+            elif isinstance(contents[filepath], Exception):
+                self._add_read_error(filepath, contents[filepath])
             else:
-                return """**What's wrong**: This markdown file lacks YAML frontmatter.
-
-**What's expected**: All markdown documentation files must start with YAML frontmatter containing tags. The frontmatter defines:
-- File type (type/concept, type/pattern, or type/index)
-- Domain tags indicating the problem domain
-- Layer tags indicating the architectural layer
-
-See CLAUDE.md for the complete schema and tag hierarchy."""
-
-        elif "inline array format" in message:
-            return """**What's wrong**: Tags are using inline array format: `tags: [tag1, tag2, tag3]`
+                issues, markers, references, links = next(results)
+                self.issues.extend(issues)
+                file_markers.append((filepath, markers.items()))
+                for lineno, marker in references:
+                    self.block_marker_references.append((filepath, lineno, marker))
+                self.check_wikilinks(filepath, links)
+
+                if not issues:
+                    new_cache[os.fspath(filepath)] = {
+                        'stamp': stamps[filepath],
+                        'hash': hashes[filepath],
+                        'markers': list(markers.items()),
+                        'references': references,
+                        'links': links,
+                    }
+            reported = self._stream_issues(reported)
+
+        # Phase 3: Validate all block marker references resolve; the marker
+        # registry is only needed, and so only built, if there are references
+        if self.block_marker_references:
+            self._register_block_markers(file_markers)
+            self.validate_all_block_marker_references()
+            self._stream_issues(reported)
+
+        self._save_scan_cache(new_cache)
+        self._set_issue_rel_paths()
+
+    def validate_file_isolated(self, filepath: Path, content: str) -> Tuple[
+            List[Issue], Dict[str, int], List[Tuple[int, str]], List[Tuple[int, str]]]:
+        """Validate one Python or markdown file without touching repository-wide state.
+
+        Returns (issues, block markers, block marker references, wikilinks) for
+        scan_repository to merge; wikilink targets are not checked here.
+        """
+        # Line offsets are computed once and shared by every whole-file scan
+        line_starts = _line_starts(content)
+        saved_issues = self.issues
+        self.issues = []
+        try:
+            if filepath.suffix == '.py':
+                markers = self.validate_python_file(filepath, content, line_starts)
+                references = []
+            else:
+                self.validate_markdown_file(filepath, content)
+                markers = {}
+                references = self.find_block_marker_references(content, line_starts)
+            return self.issues, markers, references, self.find_wikilinks(content, line_starts)
+        finally:
+            self.issues = saved_issues
+
+    def _validate_files(self, jobs: List[Tuple[Path, str]]) -> Iterator[Tuple[
+            List[Issue], Dict[str, int], List[Tuple[int, str]], List[Tuple[int, str]]]]:
+        """Run validate_file_isolated over (filepath, content) jobs, in worker processes if there are many.
+
+        Results are yielded in job order as they become available.
+        """
+        if len(jobs) < PROCESS_POOL_MIN_FILES:
+            for filepath, content in jobs:
+                yield self.validate_file_isolated(filepath, content)
+            return
 
-**What's expected**: For better Obsidian compatibility, especially with hierarchical tags using slashes (like `type/concept`, `domain/mathematics`), use YAML list format:
+        with ProcessPoolExecutor(initializer=_init_validation_worker,
+                                 initargs=(self.vault_path,)) as executor:
+            yield from executor.map(_validate_in_worker, jobs, chunksize=PROCESS_POOL_CHUNKSIZE)
 
-```yaml
----
-tags:
-  - type/concept
-  - domain/mathematics
-  - layer/core
----
-```
+    def _register_block_markers(self, file_markers: List[Tuple[Path, Any]]) -> None:
+        """Register each file's (marker, lineno) pairs for reference validation, in file order."""
+        for filepath, markers in file_markers:
+            for marker, lineno in markers:
+                # Duplicate markers across files are allowed (e.g. PLUGIN_OPERATIONS in
+                # several plugins); only the first occurrence is registered for references
+                if marker not in self.block_markers:
+                    self.block_markers[marker] = (filepath, lineno)
 
-**Why**: Obsidian's tag system works best with YAML list format for hierarchical tags. The inline array format may not properly parse nested tags with slashes.
+    def _replay_cached_file(self, filepath: Path, cached: Dict[str, Any]) -> None:
+        """Re-register a cached clean file's references and re-check its wikilinks.
 
-**How to fix**: Convert from:
-```yaml
-tags: [type/concept, domain/mathematics]
-```
+        Its markers are registered by scan_repository along with everyone else's.
+        """
+        for lineno, marker in cached['references']:
+            self.block_marker_references.append((filepath, lineno, marker))
+        # Link targets may have been added or removed since, so always re-check
+        self.check_wikilinks(filepath, cached['links'])
+
+    def _scan_cache_rules_stamp(self) -> List[Optional[int]]:
+        """Modification times of the inputs that decide whether a file is clean."""
+        stamp = []
+        for path in (self.vault_path / "schema.yaml",
+                     self.vault_path / "project_config" / "tag_rules.yaml",
+                     Path(__file__)):
+            try:
+                stamp.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return stamp
 
-To:
-```yaml
-tags:
-  - type/concept
-  - domain/mathematics
-```"""
+    def _load_scan_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached per-file results, or nothing if the cache is missing or stale."""
+        try:
+            with open(self.vault_path / SCAN_CACHE_NAME, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-        elif "missing required tag" in message:
-            tag_match = re.search(r"Missing required tag: (.+)$", issue.message)
-            required_tag = tag_match.group(1) if tag_match else "unknown"
-            return f"""**What's wrong**: The file's frontmatter is missing the required tag: `{required_tag}`
+        if (not isinstance(cache, dict)
+                or cache.get('version') != SCAN_CACHE_VERSION
+                or cache.get('rules') != self._scan_cache_rules_stamp()):
+            return {}
+        return cache.get('files', {})
+
+    def _save_scan_cache(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Persist per-file results of clean files for the next scan."""
+        cache = {
+            'version': SCAN_CACHE_VERSION,
+            'rules': self._scan_cache_rules_stamp(),
+            'files': files,
+        }
+        try:
+            with open(self.vault_path / SCAN_CACHE_NAME, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, separators=(',', ':'))
+        except OSError as e:
+            print(f"WARNING: Could not write {SCAN_CACHE_NAME}: {e}")
+
+    def _read_files(self, paths: List[Path]) -> List[Any]:
+        """Read files concurrently; each result is the file content or the exception raised."""
+        def read(path: Path) -> Any:
+            try:
+                return self.read_file(path)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            return list(executor.map(read, paths))
+
+    def _add_read_error(self, filepath: Path, error: Exception) -> None:
+        """Record a file that could not be read."""
+        self.issues.append(Issue(
+            filepath=filepath,
+            severity='error',
+            message=f"Could not read file: {error}",
+            fix_available=False
+        ))
+
+    def _stream_issues(self, start: int) -> int:
+        """Pass the issues recorded from index start on to on_issue; returns the new start."""
+        end = len(self.issues)
+        if self.on_issue is not None and start < end:
+            new_issues = self.issues[start:end]
+            self._set_issue_rel_paths(new_issues)
+            for issue in new_issues:
+                self.on_issue(issue)
+        return end
+
+    def _set_issue_rel_paths(self, issues: Optional[List[Issue]] = None) -> None:
+        """Compute each issue's vault-relative path once for all report writers.
+
+        Files usually have several issues, so paths are resolved once per file.
+        Defaults to all issues; ones that already have a path are skipped.
+        """
+        vault_str = os.fspath(self.vault_path)
+        rel_paths: Dict[str, str] = {}
+        for issue in self.issues if issues is None else issues:
+            if not issue.rel_path:
+                path_str = os.fspath(issue.filepath)
+                rel_path = rel_paths.get(path_str)
+                if rel_path is None:
+                    rel_path = rel_paths[path_str] = os.path.relpath(path_str, vault_str)
+                issue.rel_path = rel_path
+
+    def validate_buffer(self, filepath: Path, data: bytes) -> None:
+        """Validate a single file using the given bytes instead of reading it from disk.
+
+        The bytes are decoded exactly as read_file does, and undecodable
+        content is reported the same way a scan reports it.
+        Block marker references are not checked, since that requires scanning
+        every Python file in the repository.
+        """
+        try:
+            content = _decode_text(data)
+        except UnicodeDecodeError as e:
+            self._add_read_error(filepath, e)
+            self._set_issue_rel_paths()
+            return
 
-**What's expected**: Based on the file type, certain tags are mandatory:
-- Python files must have: `type/code-file`
-- Concept files must have: `type/concept`
-- Pattern files must have: `type/pattern`
-- Index files must have: `type/index`
+        if filepath.suffix == '.py':
+            self.validate_python_file(filepath, content)
+            self.extract_wikilinks(filepath, content)
+        elif filepath.suffix == '.md':
+            self.validate_markdown_file(filepath, content)
+            self.extract_wikilinks(filepath, content)
 
-The tags array in the frontmatter must include this required tag."""
+        self._set_issue_rel_paths()
 
-        elif "missing type/" in message:
-            return """**What's wrong**: The file has frontmatter but no `type/*` tag.
+    def _get_issue_type_tag(self, issue: Issue) -> str:
+        """Determine issue type tag based on the problem."""
+        # Identical messages recur across files, so classification (including
+        # lowercasing) is cached per message
+        return _classify_issue_message(issue.message)
 
-**What's expected**: Every file must have exactly one type tag that categorizes it:
-- `type/code-file` - Python source code
-- `type/concept` - Conceptual/domain documentation
-- `type/pattern` - Design pattern documentation
-- `type/index` - Index or overview file
+    def _get_issue_context(self, issue: Issue, issue_type: Optional[str] = None) -> str:
+        """Provide context about what's wrong and what's expected."""
+        if issue_type is None:
+            issue_type = self._get_issue_type_tag(issue)
 
-The type tag determines what other required tags are needed."""
+        key = issue_type
+        if issue_type == 'missing-frontmatter':
+            key += '-py' if issue.name.endswith('.py') else '-md'
 
-        elif "missing recommended tags" in message:
-            return """**What's wrong**: The file meets minimum requirements but lacks recommended tags.
+        context = _ISSUE_CONTEXTS.get(key)
+        if context is None:
+            return f"""**What's wrong**: {issue.message}
 
-**What's expected**: While not required, these tags improve organization:
-- `domain/*` - Indicates the problem domain (e.g., domain/mathematics, domain/ui)
-- `layer/*` - Indicates architectural layer (e.g., layer/core, layer/interface)
-- `pattern/*` - Indicates design patterns used (e.g., pattern/strategy)
+**What's expected**: Refer to CLAUDE.md for the complete schema and requirements for this repository."""
 
-These tags enable better filtering and organization in Obsidian's graph view."""
+        if issue_type == 'missing-required-tag':
+            tag_match = _REQUIRED_TAG_MESSAGE_RE.search(issue.message)
+            return context.format(required_tag=tag_match.group(1) if tag_match else "unknown")
 
-        else:
-            return f"""**What's wrong**: {issue.message}
+        return context
 
-**What's expected**: Refer to CLAUDE.md for the complete schema and requirements for this repository."""
+    def _issues_by_severity(self) -> Dict[str, List[Issue]]:
+        """Group issues by severity in one pass, keeping their order."""
+        groups: Dict[str, List[Issue]] = defaultdict(list)
+        for issue in self.issues:
+            groups[issue.severity].append(issue)
+        return groups
 
     def write_individual_issues(self) -> None:
         """Write each issue to a separate file in whiteboard/janitor/ folder."""
         janitor_dir = self.vault_path / 'whiteboard' / 'janitor'
 
-        # Clear out old issues
-        if janitor_dir.exists():
-            import shutil
-            shutil.rmtree(janitor_dir)
-
-        # Create fresh janitor directory
-        janitor_dir.mkdir(parents=True, exist_ok=True)
-
-        if not self.issues:
-            print(f"\nNo issues found. {janitor_dir.relative_to(self.vault_path)}/ is empty.")
-            return
-
-        # Write each issue to a separate file
+        # Build each issue file before touching the directory
+        pending: Dict[str, bytes] = {}
+        # Files usually have several issues, so each stem is made filename-safe once
+        safe_stems: Dict[str, str] = {}
         for idx, issue in enumerate(self.issues, start=1):
-            # Create filename: 01-error-filename.md or 01-warning-filename.md
-            severity_prefix = issue.severity
-            file_stem = issue.filepath.stem.replace(' ', '-')
-            issue_filename = f"{idx:02d}-{severity_prefix}-{file_stem}.md"
-            issue_path = janitor_dir / issue_filename
+            safe_stem = safe_stems.get(issue.stem)
+            if safe_stem is None:
+                safe_stem = safe_stems[issue.stem] = issue.stem.translate(_SPACE_TO_DASH)
 
-            # Build the issue content
-            rel_path = issue.filepath.relative_to(self.vault_path)
-            obsidian_link = f"[[{rel_path}|{issue.filepath.name}]]"
+            # Create filename: 01-error-filename.md or 01-warning-filename.md
+            issue_filename = f"{idx:02d}-{issue.severity}-{safe_stem}.md"
 
             # Determine issue type tag based on problem
             issue_type = self._get_issue_type_tag(issue)
 
-            lines = [
-                "---",
-                f"tags: [janitor-issue, janitor-issue/{issue_type}, severity/{issue.severity}]",
-                "---",
-                "",
-                f"# Issue #{idx}: {issue.filepath.name}",
-                "",
-                f"**File**: {obsidian_link}",
-                "",
-                f"**Severity**: {issue.severity.upper()}",
-                "",
-                f"**Path**: `{rel_path}`",
-                "",
-                "## Problem",
-                "",
-                issue.message,
-                "",
-            ]
-
-            # Add context about what's wrong and what's expected
-            lines.extend([
-                "## Context",
-                "",
-                self._get_issue_context(issue),
-                "",
-            ])
-
+            # Build the issue content, including context about what's wrong and what's expected
+            content = _ISSUE_FILE_TEMPLATE.format(
+                idx=idx,
+                issue_type=issue_type,
+                severity=issue.severity,
+                severity_upper=issue.severity.upper(),
+                name=issue.name,
+                rel_path=issue.rel_path,
+                message=issue.message,
+                context=self._get_issue_context(issue, issue_type),
+            )
             if issue.fix_available:
-                lines.extend([
-                    "## Note",
-                    "",
-                    f"Auto-fix available: `{issue.fix_description}`",
-                    "",
-                    "Run `python janitor.py --fix` to apply automatically.",
-                    "",
-                ])
+                content += _ISSUE_FILE_FIX_NOTE_TEMPLATE.format(fix_description=issue.fix_description)
+
+            pending[issue_filename] = content.encode('utf-8')
+
+        # Remove files of issues that are gone, noting the size of the others
+        existing: Dict[str, int] = {}
+        if janitor_dir.is_dir():
+            with os.scandir(janitor_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    if entry.name in pending:
+                        existing[entry.name] = entry.stat().st_size
+                    else:
+                        os.unlink(entry.path)
+        else:
+            janitor_dir.mkdir(parents=True, exist_ok=True)
 
-            issue_path.write_text('\n'.join(lines), encoding='utf-8')
+        if not self.issues:
+            print(f"\nNo issues found. {janitor_dir.relative_to(self.vault_path)}/ is empty.")
+            return
+
+        def write_if_changed(item: Tuple[str, bytes]) -> None:
+            filename, data = item
+            path = janitor_dir / filename
+            # Unchanged files are left alone so repeated runs do not rewrite them
+            if existing.get(filename) == len(data) and path.read_bytes() == data:
+                return
+            path.write_bytes(data)
+
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            # Consume the iterator so write errors propagate
+            list(executor.map(write_if_changed, pending.items()))
 
         print(f"\n{len(self.issues)} issue files written to {janitor_dir.relative_to(self.vault_path)}/")
 
@@ -1086,78 +1627,36 @@ These tags enable better filtering and organization in Obsidian's graph view."""
         # Ensure janitor directory exists
         janitor_dir.mkdir(parents=True, exist_ok=True)
 
-        errors = [i for i in self.issues if i.severity == 'error']
-        warnings = [i for i in self.issues if i.severity == 'warning']
-
-        # Build markdown report
-        lines = [
-            "---",
-            "tags: [janitor-report, type/index]",
-            "---",
-            "",
-            "# Janitor Report",
-            "",
-            f"**Generated**: {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-        ]
+        by_severity = self._issues_by_severity()
+        errors, warnings = by_severity['error'], by_severity['warning']
+
+        # Stream the markdown report section by section; sections are separated by blank lines
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with open(report_path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+            f.write(_REPORT_HEADER_TEMPLATE.format(generated=generated))
+
+            if not self.issues:
+                f.write('\n')
+                f.write(_REPORT_HEALTHY)
+            else:
+                f.write('\n')
+                f.write(_REPORT_SUMMARY_TEMPLATE.format(
+                    errors=len(errors), warnings=len(warnings), total=len(self.issues)
+                ))
+
+                for heading, group in (("Errors", errors), ("Warnings", warnings)):
+                    if not group:
+                        continue
+                    f.write(f"\n## {heading}\n")
+                    for issue in group:
+                        # Each entry links to the file with an Obsidian wikilink
+                        f.write('\n')
+                        f.write(_REPORT_ISSUE_TEMPLATE.format(
+                            rel_path=issue.rel_path, name=issue.name, message=issue.message
+                        ))
+                        if issue.fix_available:
+                            f.write(_REPORT_FIX_NOTE)
 
-        if not self.issues:
-            lines.extend([
-                "## Status",
-                "",
-                "**Repository is healthy!** No issues found.",
-                "",
-            ])
-        else:
-            lines.extend([
-                "## Summary",
-                "",
-                f"- **Errors**: {len(errors)}",
-                f"- **Warnings**: {len(warnings)}",
-                f"- **Total Issues**: {len(self.issues)}",
-                "",
-            ])
-
-            if errors:
-                lines.extend([
-                    "## Errors",
-                    "",
-                ])
-                for issue in errors:
-                    rel_path = issue.filepath.relative_to(self.vault_path)
-                    # Create Obsidian wikilink to the file
-                    obsidian_link = f"[[{rel_path}|{issue.filepath.name}]]"
-                    lines.append(f"### {obsidian_link}")
-                    lines.append("")
-                    lines.append(f"**File**: `{rel_path}`")
-                    lines.append("")
-                    lines.append(f"**Problem**: {issue.message}")
-                    lines.append("")
-                    if issue.fix_available:
-                        lines.append(f"**Auto-fix available**: Run `python janitor.py --fix`")
-                        lines.append("")
-
-            if warnings:
-                lines.extend([
-                    "## Warnings",
-                    "",
-                ])
-                for issue in warnings:
-                    rel_path = issue.filepath.relative_to(self.vault_path)
-                    # Create Obsidian wikilink to the file
-                    obsidian_link = f"[[{rel_path}|{issue.filepath.name}]]"
-                    lines.append(f"### {obsidian_link}")
-                    lines.append("")
-                    lines.append(f"**File**: `{rel_path}`")
-                    lines.append("")
-                    lines.append(f"**Problem**: {issue.message}")
-                    lines.append("")
-                    if issue.fix_available:
-                        lines.append(f"**Auto-fix available**: Run `python janitor.py --fix`")
-                        lines.append("")
-
-        # Write report
-        report_path.write_text('\n'.join(lines), encoding='utf-8')
         print(f"\nReport written to {report_path.relative_to(self.vault_path)}")
 
     def report_issues(self) -> None:
@@ -1166,13 +1665,13 @@ These tags enable better filtering and organization in Obsidian's graph view."""
             print("No issues found! Repository is healthy.")
             return
 
-        errors = [i for i in self.issues if i.severity == 'error']
-        warnings = [i for i in self.issues if i.severity == 'warning']
+        by_severity = self._issues_by_severity()
+        errors, warnings = by_severity['error'], by_severity['warning']
 
         if errors:
             print(f"\n{len(errors)} ERROR(S) FOUND:\n")
             for issue in errors:
-                print(f"  {issue.filepath.relative_to(self.vault_path)}")
+                print(f"  {issue.rel_path}")
                 print(f"    {issue.message}")
                 if issue.fix_available:
                     print(f"    Fix: {issue.fix_description}")
@@ -1181,7 +1680,7 @@ These tags enable better filtering and organization in Obsidian's graph view."""
         if warnings:
             print(f"\n{len(warnings)} WARNING(S) FOUND:\n")
             for issue in warnings:
-                print(f"  {issue.filepath.relative_to(self.vault_path)}")
+                print(f"  {issue.rel_path}")
                 print(f"    {issue.message}")
                 if issue.fix_available:
                     print(f"    Fix: {issue.fix_description}")
@@ -1189,7 +1688,7 @@ These tags enable better filtering and organization in Obsidian's graph view."""
 
     def apply_fixes(self, auto_yes: bool = False) -> int:
         """Apply automatic fixes to issues."""
-        fixable = [i for i in self.issues if i.fix_available and i.auto_fix_fn]
+        fixable = [i for i in self.issues if i.fix_available and i.auto_fix]
 
         if not fixable:
             print("\nNo auto-fixable issues found.")
@@ -1197,7 +1696,7 @@ These tags enable better filtering and organization in Obsidian's graph view."""
 
         print(f"\n{len(fixable)} issue(s) can be auto-fixed:")
         for issue in fixable:
-            print(f"  - {issue.filepath.relative_to(self.vault_path)}: {issue.fix_description}")
+            print(f"  - {issue.rel_path}: {issue.fix_description}")
 
         if not auto_yes:
             response = input("\nApply these fixes? [y/N] ").strip().lower()
@@ -1205,35 +1704,115 @@ These tags enable better filtering and organization in Obsidian's graph view."""
                 print("Fixes cancelled.")
                 return 0
 
-        fixed_count = 0
+        dispatch = {
+            'add_python_docstring': self.fix_add_python_docstring,
+            'add_tag': self.fix_add_tag,
+            'add_markdown_frontmatter': self.fix_add_markdown_frontmatter,
+            'add_property': self.fix_add_property,
+        }
+
+        # Apply all of a file's fixes to its content in turn, then write it once
+        by_file: Dict[Path, List[Issue]] = defaultdict(list)
         for issue in fixable:
+            by_file[issue.auto_fix.filepath].append(issue)
+
+        outcomes: Dict[int, str] = {}  # id(issue) -> result line
+        fixed_count = 0
+        for filepath, file_issues in by_file.items():
             try:
-                if issue.auto_fix_fn():
-                    print(f"  ✓ Fixed: {issue.filepath.name}")
-                    fixed_count += 1
+                content = filepath.read_text(encoding='utf-8')
+            except Exception as e:
+                for issue in file_issues:
+                    outcomes[id(issue)] = f"  ✗ Error fixing {issue.name}: {e}"
+                continue
+
+            applied = []
+            for issue in file_issues:
+                fix = issue.auto_fix
+                try:
+                    new_content = dispatch[fix.kind](filepath, content, *fix.args)
+                except Exception as e:
+                    outcomes[id(issue)] = f"  ✗ Error fixing {issue.name}: {e}"
+                    continue
+                if new_content is None:
+                    outcomes[id(issue)] = f"  ✗ Could not fix: {issue.name}"
                 else:
-                    print(f"  ✗ Could not fix: {issue.filepath.name}")
+                    content = new_content
+                    applied.append(issue)
+
+            if not applied:
+                continue
+            try:
+                filepath.write_text(content, encoding='utf-8')
             except Exception as e:
-                print(f"  ✗ Error fixing {issue.filepath.name}: {e}")
+                for issue in applied:
+                    outcomes[id(issue)] = f"  ✗ Error fixing {issue.name}: {e}"
+                continue
+            for issue in applied:
+                outcomes[id(issue)] = f"  ✓ Fixed: {issue.name}"
+            fixed_count += len(applied)
+
+        for issue in fixable:
+            print(outcomes[id(issue)])
 
         print(f"\n✓ Fixed {fixed_count} issue(s)")
         return fixed_count
 
 
+# RepositoryJanitor of a validation worker process, built once by _init_validation_worker
+_worker_janitor: Optional[RepositoryJanitor] = None
+
+
+def _init_validation_worker(vault_path: Path) -> None:
+    """Load the schema and tag rules once per worker process."""
+    global _worker_janitor
+    _worker_janitor = RepositoryJanitor(vault_path)
+
+
+def _validate_in_worker(job: Tuple[Path, str]):
+    """Validate one (filepath, content) job in a worker process."""
+    return _worker_janitor.validate_file_isolated(*job)
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Repository health checker and fixer')
     parser.add_argument('--fix', action='store_true', help='Apply automatic fixes')
     parser.add_argument('--yes', '-y', action='store_true', help='Auto-confirm fixes')
+    parser.add_argument('--stdin', metavar='PATH',
+                        help='Validate content read from stdin as the .py or .md file at PATH '
+                             '(nothing is read from or written to disk; --stream has no effect)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Print each issue as soon as it is found, ahead of the full report')
     args = parser.parse_args()
 
+    def print_issue(issue: Issue) -> None:
+        print(f"{issue.severity}: {issue.rel_path}: {issue.message}", flush=True)
+
     # Script is in maintenance_scripts/, root is parent
     vault_path = Path(__file__).parent.parent
-    janitor = RepositoryJanitor(vault_path)
+    janitor = RepositoryJanitor(vault_path, on_issue=print_issue if args.stream else None)
+
+    if args.stdin:
+        if args.fix:
+            parser.error('--fix cannot be combined with --stdin')
+
+        filepath = (Path.cwd() / args.stdin).resolve()
+        if not filepath.is_relative_to(vault_path.resolve()):
+            parser.error(f'{args.stdin} is not inside the repository')
+        if filepath.suffix not in ('.py', '.md'):
+            parser.error(f'{args.stdin} is not a .py or .md file')
+
+        # Report paths relative to the resolved vault root
+        janitor.vault_path = vault_path.resolve()
+        janitor.validate_buffer(filepath, sys.stdin.buffer.read())
+        janitor.report_issues()
+        return
 
     print("Scanning repository...\n")
-    janitor.scan_repository()
+    # Fixes are planned from a full validation rather than cached results
+    janitor.scan_repository(use_cache=not args.fix)
     janitor.report_issues()
     janitor.write_individual_issues()
     janitor.write_report()
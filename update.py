@@ -6,7 +6,8 @@
 **Inheritable Tags**: #domain/automation #layer/infrastructure #category/infrastructure
 
 ## Purpose
-Simple orchestrator that runs repository maintenance scripts in sequence.
+Simple orchestrator that runs repository maintenance scripts in sequence,
+all in this one Python process.
 
 This is a pure container - all actual logic lives in the individual scripts.
 
@@ -22,11 +23,12 @@ Usage:
     uv run update.py
 """
 
-import subprocess
+import importlib
 import sys
+import traceback
 from pathlib import Path
 
-# Workflow: list of (script_name, is_critical)
+# Workflow: list of (script_name, is_critical), in dependency order
 # Critical scripts stop the workflow on failure
 # Non-critical scripts continue even if they fail
 WORKFLOW = [
@@ -38,15 +40,36 @@ WORKFLOW = [
 ]
 
 
+def run_script(root: Path, script: str) -> bool:
+    """Import a maintenance script and run its main(), as if it had been run directly.
+
+    Scripts share this interpreter, so startup and common imports (yaml, ast)
+    are paid once rather than per script. Returns whether the script succeeded.
+    """
+    saved_argv = sys.argv
+    sys.argv = [str(root / script)]
+    try:
+        module = importlib.import_module(script.removesuffix(".py").replace("/", "."))
+        module.main()
+    except SystemExit as e:
+        return e.code in (None, 0)
+    except Exception:
+        traceback.print_exc()
+        return False
+    finally:
+        sys.argv = saved_argv
+        sys.stdout.flush()
+    return True
+
+
 def main():
     """Run all maintenance scripts in sequence."""
     root = Path(__file__).parent
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
 
     for script, is_critical in WORKFLOW:
-        script_path = root / script
-        try:
-            subprocess.run([sys.executable, str(script_path)], check=True, cwd=root)
-        except subprocess.CalledProcessError:
+        if not run_script(root, script):
             if is_critical:
                 print(f"\n{script} failed (critical). Stopping workflow.")
                 sys.exit(1)